@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+"""
+asyncio friendly traversals and whole-graph checks.
+
+The methods of Graph run to completion without giving control back, so a big
+traversal blocks the event loop of an asyncio application. The coroutines in
+this module do the same work but yield to the loop every *yield_every* visited
+vertices, so other tasks keep running. They can be cancelled like any other
+task and accept a *timeout* (in seconds), raising asyncio.TimeoutError when it
+expires.
+
+    closure = await transitive_closure(graph, "a", yield_every=500, timeout=2.0)
+
+When the work should not run on the loop thread at all, use offload() to run
+any Graph method in an executor. The graph must not be changed while the
+executor is reading it (ConcurrentGraph snapshots are safe to offload).
+
+Other tasks may change the graph while a coroutine is waiting for its turn.
+The coroutines don't fail when that happens, but their result then mixes
+versions of the graph: a traversal follows the edges as they are when it
+reaches each vertex, and is_regular only checks the vertices that existed
+when it started (and still exist). Pass a ConcurrentGraph snapshot to work on
+a single version.
+
+=========================================
+
+Coroutines:
+
+    list(vertex) bfs(graph, vertex)
+    set(vertex) transitive_closure(graph, vertex)
+    bool is_connected(graph)
+    bool is_regular(graph)
+    offload(graph, method, *arguments)
+
+=========================================
+
+@license: MIT License
+"""
+
+import asyncio
+import collections
+import functools
+
+YIELD_EVERY = 1000
+
+def _neighbours(graph):
+    if graph._digraph:
+        return graph.sucessors
+    return graph.adjacents_to
+
+async def _with_timeout(coroutine, timeout):
+    if timeout is None:
+        return await coroutine
+    return await asyncio.wait_for(coroutine, timeout)
+
+async def _bfs(graph, vertex, yield_every):
+    if vertex not in graph._vertices:
+        return []
+    neighbours = _neighbours(graph)
+    visited = set([vertex])
+    order = []
+    queue = collections.deque([vertex])
+    while queue:
+        current = queue.popleft()
+        order.append(current)
+        if len(order) % yield_every == 0:
+            await asyncio.sleep(0)
+        for v in neighbours(current):
+            if v not in visited:
+                visited.add(v)
+                queue.append(v)
+    return order
+
+async def bfs(graph, vertex, yield_every=YIELD_EVERY, timeout=None):
+    """ Breadth-first search starting at *vertex*.
+
+    Works for graphs and digraphs (following sucessors).
+
+    :param graph: The graph to be traversed.
+    :param vertex: The vertex where the search starts.
+    :param yield_every: Number of visited vertices between two yields to the loop.
+    :param timeout: Maximum number of seconds to run, or None to run until the end.
+    :return A list of vertices in the order they were visited.
+    """
+    return await _with_timeout(_bfs(graph, vertex, yield_every), timeout)
+
+async def transitive_closure(graph, vertex, yield_every=YIELD_EVERY, timeout=None):
+    """ Return every vertex reachable from *vertex*, *vertex* itself included.
+
+    :param graph: A not directed graph.
+    :param vertex: The starting vertex.
+    :param yield_every: Number of visited vertices between two yields to the loop.
+    :param timeout: Maximum number of seconds to run, or None to run until the end.
+    :return A set of vertices.
+    """
+    if graph._digraph:
+        raise NotImplementedError
+    return set(await _with_timeout(_bfs(graph, vertex, yield_every), timeout))
+
+async def is_connected(graph, yield_every=YIELD_EVERY, timeout=None):
+    """ Check whether every vertex can be reached from any other vertex.
+
+    :param graph: A not directed graph.
+    :param yield_every: Number of visited vertices between two yields to the loop.
+    :param timeout: Maximum number of seconds to run, or None to run until the end.
+    :return True if the graph is connected.
+    """
+    if graph._digraph:
+        raise NotImplementedError
+    if graph.order() == 0:
+        return True
+    reached = await _with_timeout(_bfs(graph, graph.random(), yield_every), timeout)
+    return len(reached) == graph.order()
+
+async def _is_regular(graph, yield_every):
+    n = None
+    for i, vertex in enumerate(list(graph._vertices)):
+        if i % yield_every == yield_every - 1:
+            await asyncio.sleep(0)
+        if vertex not in graph._vertices:
+            continue
+        if n is None:
+            n = graph.degree(vertex)
+        elif graph.degree(vertex) != n:
+            return False
+    return True
+
+async def is_regular(graph, yield_every=YIELD_EVERY, timeout=None):
+    """ Check whether every vertex has the same degree.
+
+    :param graph: A not directed graph.
+    :param yield_every: Number of checked vertices between two yields to the loop.
+    :param timeout: Maximum number of seconds to run, or None to run until the end.
+    :return True if the graph is regular.
+    """
+    if graph._digraph:
+        raise NotImplementedError
+    return await _with_timeout(_is_regular(graph, yield_every), timeout)
+
+async def offload(graph, method, *arguments, executor=None, timeout=None):
+    """ Run graph.method(*arguments) in an executor and wait for the result.
+
+    :param graph: The graph (or ConcurrentGraph snapshot) to be queried.
+    :param method: The name of the method, e.g. "is_connected".
+    :param executor: The executor to be used, defaults to the loop's one.
+    :param timeout: Maximum number of seconds to wait for the result.
+    :return The value returned by the method.
+    """
+    loop = asyncio.get_running_loop()
+    call = functools.partial(getattr(graph, method), *arguments)
+    return await _with_timeout(loop.run_in_executor(executor, call), timeout)
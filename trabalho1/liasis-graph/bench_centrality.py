@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+"""
+Benchmark for the centrality module on a random graph.
+
+Builds a G(n, p) random graph with about the given number of edges and times
+PageRank, sampled betweenness (in this process and in a process pool) and
+closeness of a sample of vertices.
+
+Usage:
+
+    python bench_centrality.py [edges] [processes] [samples]
+"""
+
+import random
+import sys
+import time
+import centrality
+import generators
+
+def timed(label, function, *arguments, **options):
+    start = time.time()
+    result = function(*arguments, **options)
+    print("%-36s %8.2fs" % (label, time.time() - start))
+    return result
+
+def main():
+    m = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    processes = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    samples = int(sys.argv[3]) if len(sys.argv) > 3 else 32
+    n = max(2, m // 10)
+
+    graph = timed("build (%d vertices, ~%d edges)" % (n, m), generators.erdos_renyi,
+                  n, 2.0 * m / (n * (n - 1.0)), seed=0)
+    timed("pagerank", centrality.pagerank, graph, tolerance=1.0e-6)
+    timed("betweenness, %d samples" % samples, centrality.betweenness,
+          graph, samples=samples, seed=0)
+    timed("betweenness, %d samples, %d processes" % (samples, processes),
+          centrality.betweenness, graph, samples=samples, seed=0, processes=processes)
+    sample = random.Random(1).sample(range(n), min(n, samples))
+    timed("closeness, %d vertices" % len(sample), centrality.closeness, graph, vertices=sample)
+    timed("closeness, %d vertices, %d processes" % (len(sample), processes),
+          centrality.closeness, graph, vertices=sample, processes=processes)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+"""
+Benchmark for the community module on a planted partition graph.
+
+Builds groups of 50 vertices where 90% of the edges fall inside a group, then
+times label propagation and Louvain (in this process and in a process pool)
+and prints the number of communities found and their modularity.
+
+Usage:
+
+    python bench_community.py [edges] [processes]
+"""
+
+import random
+import sys
+import time
+import community
+from graph import Graph
+
+def build(m, rnd, group=50):
+    n = max(group, m // 5)
+    vertices = dict((v, set()) for v in range(n))
+    groups = n // group
+    for _ in range(m):
+        if rnd.random() < 0.9:
+            g = rnd.randrange(groups) * group
+            a, b = g + rnd.randrange(group), g + rnd.randrange(group)
+        else:
+            a, b = rnd.randrange(n), rnd.randrange(n)
+        if a != b:
+            vertices[a].add(b)
+            vertices[b].add(a)
+    return Graph(vertices)
+
+def run(label, graph, function, **options):
+    start = time.time()
+    partition = function(graph, seed=0, **options)
+    elapsed = time.time() - start
+    print("%-32s %8.2fs %8d communities, modularity %.4f" % (
+        label, elapsed, len(set(partition[1])), community.modularity(graph, partition)))
+
+def main():
+    m = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    processes = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+
+    start = time.time()
+    graph = build(m, random.Random(0))
+    print("build (%d vertices, ~%d edges) %8.2fs" % (graph.order(), m, time.time() - start))
+    run("label propagation", graph, community.label_propagation)
+    run("label propagation, %d processes" % processes, graph,
+        community.label_propagation, processes=processes)
+    run("louvain", graph, community.louvain)
+    run("louvain, %d processes" % processes, graph, community.louvain, processes=processes)
+
+if __name__ == "__main__":
+    main()
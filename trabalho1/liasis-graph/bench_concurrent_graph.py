@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+"""
+Stress benchmark for ConcurrentGraph.
+
+Starts several reader threads that keep querying the graph (sucessors /
+adjacents_to, degree, order) while a single writer thread applies batches of
+random connect/disconnect operations. Reports the read throughput with and
+without the writer running, and how many versions were published. Then
+times single-edge writes (one version each) on a graph with a large number
+of vertices, where copying the whole dictionary on each write would show.
+
+Usage:
+
+    python bench_concurrent_graph.py [vertices] [readers] [seconds] [large vertices]
+"""
+
+import random
+import sys
+import threading
+import time
+import generators
+from concurrent_graph import ConcurrentGraph
+
+def reader(graph, n, stop, counts, index):
+    rnd = random.Random(index)
+    reads = 0
+    while not stop.is_set():
+        v = rnd.randrange(n)
+        graph.adjacents_to(v)
+        graph.degree(v)
+        graph.order()
+        reads += 3
+    counts[index] = reads
+
+def writer(graph, n, stop, batch_size, published):
+    rnd = random.Random(-1)
+    while not stop.is_set():
+        with graph.batch() as w:
+            for _ in range(batch_size):
+                a, b = rnd.randrange(n), rnd.randrange(n)
+                if rnd.random() < 0.5:
+                    w.connect(a, b)
+                else:
+                    w.disconnect(a, b)
+        published[0] += 1
+
+def run(graph, n, readers, seconds, with_writer, batch_size=100):
+    stop = threading.Event()
+    counts = [0] * readers
+    published = [0]
+    threads = [threading.Thread(target=reader, args=(graph, n, stop, counts, i))
+               for i in range(readers)]
+    if with_writer:
+        threads.append(threading.Thread(target=writer, args=(graph, n, stop, batch_size, published)))
+    for t in threads:
+        t.start()
+    time.sleep(seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+    return sum(counts) / float(seconds), published[0]
+
+def write_latency(n, writes=2000):
+    graph = ConcurrentGraph(dict((v, set()) for v in range(n)))
+    rnd = random.Random(-2)
+    start = time.time()
+    for _ in range(writes):
+        graph.connect(rnd.randrange(n), rnd.randrange(n))
+    return (time.time() - start) / writes
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    readers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    seconds = float(sys.argv[3]) if len(sys.argv) > 3 else 3.0
+    large = int(sys.argv[4]) if len(sys.argv) > 4 else 1000000
+
+    graph = ConcurrentGraph(generators.erdos_renyi(n, 8.0 / n, seed=0)._vertices)
+    print("vertices: %d, readers: %d, seconds: %.1f" % (n, readers, seconds))
+
+    throughput, _ = run(graph, n, readers, seconds, with_writer=False)
+    print("reads/s without writer: %12.0f" % throughput)
+
+    throughput, published = run(graph, n, readers, seconds, with_writer=True)
+    print("reads/s with writer:    %12.0f (%d versions published)" % (throughput, published))
+
+    print("connect on %d vertices: %9.3fms per write" % (large, 1000 * write_latency(large)))
+
+if __name__ == "__main__":
+    main()
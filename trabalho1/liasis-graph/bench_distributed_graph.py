@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+"""
+Scaling benchmark for PartitionedGraph.
+
+Builds a G(n, p) random graph and times a full level-synchronous BFS
+and is_connected with 1, 2, ... N worker processes (hash partitioning), next
+to the time of a BFS in a single process on the original Graph. The start up
+of the workers (copying the graph and finding the owners of the neighbours)
+is timed apart.
+
+Usage:
+
+    python bench_distributed_graph.py [edges] [workers]
+"""
+
+import collections
+import sys
+import time
+import generators
+from distributed_graph import PartitionedGraph
+
+def local_bfs(graph, vertex):
+    levels = {vertex: 0}
+    queue = collections.deque([vertex])
+    while queue:
+        v = queue.popleft()
+        for u in graph.adjacents_to(v):
+            if u not in levels:
+                levels[u] = levels[v] + 1
+                queue.append(u)
+    return levels
+
+def main():
+    m = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    n = max(2, m // 10)
+    graph = generators.erdos_renyi(n, 2.0 * m / (n * (n - 1.0)), seed=0)
+
+    start = time.time()
+    local_bfs(graph, 0)
+    print("%-28s %8.2fs" % ("bfs, single process", time.time() - start))
+
+    for w in range(1, workers + 1):
+        start = time.time()
+        with PartitionedGraph(graph, workers=w) as partitioned:
+            partitioned.order()
+            started = time.time() - start
+            start = time.time()
+            partitioned.bfs(0)
+            bfs = time.time() - start
+            start = time.time()
+            partitioned.is_connected()
+            connected = time.time() - start
+        print("%-28s %8.2fs   is_connected %8.2fs   start %8.2fs" % (
+            "bfs, %d workers" % w, bfs, connected, started))
+
+if __name__ == "__main__":
+    main()
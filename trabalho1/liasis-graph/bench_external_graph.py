@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+"""
+Benchmark for ExternalGraph.
+
+Writes a random not directed graph to a temporary directory, then runs random
+adjacency queries and a full BFS with page caches of different sizes, and
+prints the time, hit rate and bytes read of each run.
+
+Usage:
+
+    python bench_external_graph.py [edges] [shards]
+"""
+
+import random
+import shutil
+import sys
+import tempfile
+import time
+from external_graph import ExternalGraph
+
+def edges(n, m, rnd):
+    for _ in range(m):
+        yield rnd.randrange(n), rnd.randrange(n)
+
+def report(label, graph, elapsed, stats):
+    print("%-34s %8.2fs  hit rate %5.1f%%  %10d bytes read" % (
+        label, elapsed, 100 * stats["hit_rate"], stats["bytes_read"]))
+
+def main():
+    m = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    shards = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+    n = max(2, m // 10)
+    directory = tempfile.mkdtemp()
+    try:
+        start = time.time()
+        graph = ExternalGraph.build(directory, edges(n, m, random.Random(0)), shards=shards)
+        print("build (%d vertices, %d edges, %d shards) %8.2fs" % (n, m, shards, time.time() - start))
+        total = graph.memory_size()
+        print("%d bytes on disk, %d bytes in memory once loaded" % (graph.disk_size(), total))
+        graph.close()
+
+        for fraction in (0.1, 0.5, 1.0):
+            graph = ExternalGraph(directory, memory_budget=int(total * fraction))
+            rnd = random.Random(1)
+            start = time.time()
+            for _ in range(10000):
+                graph.adjacents_to(rnd.randrange(n))
+            report("10000 queries, budget %3d%%" % (100 * fraction), graph,
+                   time.time() - start, graph.stats())
+            start = time.time()
+            graph.bfs(0)
+            report("bfs, budget %3d%%" % (100 * fraction), graph,
+                   time.time() - start, graph.last_query_stats())
+            graph.close()
+    finally:
+        shutil.rmtree(directory)
+
+if __name__ == "__main__":
+    main()
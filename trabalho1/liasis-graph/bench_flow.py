@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+"""
+Benchmark for the flow module.
+
+Times Hopcroft-Karp on a random bipartite digraph (workers -> jobs) and
+Dinic's max flow on a random layered network with integer capacities, both
+with the given number of arcs.
+
+Usage:
+
+    python bench_flow.py [arcs]
+"""
+
+import random
+import sys
+import time
+import flow
+from graph import Graph
+
+def bipartite(m, rnd, degree=10):
+    n = max(1, m // degree)
+    vertices = dict((("w", i), set()) for i in range(n))
+    vertices.update((("j", i), set()) for i in range(n))
+    for i in range(n):
+        worker = vertices[("w", i)]
+        while len(worker) < min(degree, n):
+            worker.add(("j", rnd.randrange(n)))
+    return Graph(vertices, digraph=True), [("w", i) for i in range(n)]
+
+def layered(m, rnd, width=1000, degree=10):
+    layers = max(1, m // (width * degree))
+    vertices = {"s": set(), "t": set()}
+    capacities = {}
+    for layer in range(layers):
+        for i in range(width):
+            vertices[(layer, i)] = set()
+    for i in range(width):
+        vertices["s"].add((0, i))
+        vertices[(layers - 1, i)].add("t")
+    for layer in range(layers - 1):
+        for i in range(width):
+            arcs = vertices[(layer, i)]
+            while len(arcs) < degree:
+                arcs.add((layer + 1, rnd.randrange(width)))
+    graph = Graph(vertices, digraph=True)
+    for v in vertices:
+        for u in vertices[v]:
+            capacities[(v, u)] = rnd.randrange(1, 100)
+    graph.set_edge_attributes("capacity", capacities)
+    return graph
+
+def timed(label, function, *arguments):
+    start = time.time()
+    result = function(*arguments)
+    print("%-40s %8.2fs" % (label, time.time() - start))
+    return result
+
+def main():
+    m = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    rnd = random.Random(0)
+
+    graph, workers = timed("build bipartite (%d arcs)" % m, bipartite, m, rnd)
+    matching = timed("hopcroft_karp", flow.hopcroft_karp, graph, workers)
+    print("%-40s %8d" % ("matched", len(matching)))
+
+    graph = timed("build layered network (~%d arcs)" % m, layered, m, rnd)
+    value, _ = timed("max_flow", flow.max_flow, graph, "s", "t")
+    print("%-40s %8d" % ("flow", value))
+
+if __name__ == "__main__":
+    main()
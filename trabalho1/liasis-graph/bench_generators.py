@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+"""
+Benchmark for the graph generators.
+
+Times every generator for a target number of edges and prints the number of
+edges actually built.
+
+Usage:
+
+    python bench_generators.py [edges]
+"""
+
+import math
+import sys
+import time
+import generators
+
+def edges(graph):
+    return sum(len(graph._vertices[v]) for v in graph._vertices) // (1 if graph._digraph else 2)
+
+def timed(label, function, *arguments, **options):
+    start = time.time()
+    graph = function(*arguments, **options)
+    print("%-24s %8.2fs %10d vertices %10d edges" % (
+        label, time.time() - start, graph.order(), edges(graph)))
+
+def main():
+    m = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    n = max(4, m // 8)
+    side = int(math.sqrt(m / 2.0)) + 1
+    timed("erdos_renyi", generators.erdos_renyi, n, 2.0 * m / (n * (n - 1.0)), seed=0)
+    timed("barabasi_albert", generators.barabasi_albert, n, 8, seed=0)
+    timed("watts_strogatz", generators.watts_strogatz, n, 16, 0.1, seed=0)
+    timed("rmat", generators.rmat, max(1, int(math.log(n, 2))), 8, seed=0)
+    timed("grid_graph", generators.grid_graph, side, side)
+    timed("complete_graph", generators.complete_graph, int(math.sqrt(2.0 * m)) + 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+"""
+Benchmark for the spanning module.
+
+Times Kruskal and Prim on a sparse random graph (average degree 10) and on a
+dense one (every edge present with probability 1/2), both with about the given
+number of edges and random weights.
+
+Usage:
+
+    python bench_spanning.py [edges]
+"""
+
+import random
+import sys
+import time
+import generators
+import spanning
+
+def weighted(graph, rnd):
+    weights = {}
+    for v in graph._vertices:
+        for u in graph._vertices[v]:
+            if v < u:
+                weights[(v, u)] = rnd.random()
+    graph.set_edge_attributes("weight", weights)
+    return graph
+
+def timed(label, function, *arguments):
+    start = time.time()
+    result = function(*arguments)
+    print("%-48s %8.2fs" % (label, time.time() - start))
+    return result
+
+def main():
+    m = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    rnd = random.Random(0)
+
+    for name, n in (("sparse", max(2, m // 5)), ("dense", max(2, int((4 * m) ** 0.5)))):
+        p = min(1.0, 2.0 * m / (n * (n - 1.0)))
+        graph = timed("build %s (%d vertices, ~%d edges)" % (name, n, m),
+                      lambda: weighted(generators.erdos_renyi(n, p, seed=0), rnd))
+        _, first = timed("kruskal", spanning.kruskal, graph)
+        _, second = timed("prim", spanning.prim, graph)
+        print("%-48s %8.2f %8.2f" % ("total weight", first, second))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+"""
+A Graph that memoizes its derived properties.
+
+CachedGraph answers is_regular, is_complete, is_connected, is_tree and
+transitive_closure from a cache while the graph doesn't change. The cache
+is stamped with the graph version (see Graph.version), which every effective
+add/remove/connect/disconnect bumps, so the first query after a mutation
+recomputes the result and the following ones are served from the cache.
+
+Whole-graph results take a single entry each. Per-vertex results (the
+transitive closures) are kept in a LRU cache of at most *maxsize* entries.
+Closures are cached as frozensets and a new set is returned on each call, as
+in Graph, so callers may change the results freely (the copy costs O(size)).
+vertices() isn't cached: copying a cached set would cost as much as Graph's
+own O(V) answer.
+
+Changing the internal dictionary directly (graph._vertices) bypasses the
+version and leaves stale results behind.
+
+=========================================
+
+Cached methods:
+
+    set(vertex) transitive_closure(vertex)
+    bool is_regular()
+    bool is_complete()
+    bool is_tree()
+    bool is_connected()
+
+Cache methods:
+
+    dict cache_stats()
+    void cache_clear()
+
+=========================================
+
+@license: MIT License
+"""
+
+import collections
+from graph import Graph
+
+class CachedGraph(Graph):
+
+    def __init__(self, vertices=None, digraph=False, maxsize=128):
+        """ Creates a new cached graph.
+
+        :param vertices: A dictionary of vertices to be setted as vertices for the new graph.
+        :param digraph: True if the graph is a directed graph. Defaults to false.
+        :param maxsize: Maximum number of per-vertex results kept. Defaults to 128.
+        :return None
+        """
+        Graph.__init__(self, vertices if vertices is not None else {}, digraph)
+        self._maxsize = maxsize
+        self._cache_version = self._version
+        self._results = {}
+        self._closures = collections.OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    #######################
+    ##  Cache Operations ##
+    #######################
+
+    def cache_stats(self):
+        """ Return the cache statistics.
+
+        :return A dictionary with "hits", "misses", "closures" (number of per-vertex
+                results currently cached) and "maxsize".
+        """
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "closures": len(self._closures),
+            "maxsize": self._maxsize,
+        }
+
+    def cache_clear(self):
+        """ Drop every cached result and reset the statistics.
+
+        :return None
+        """
+        self._results.clear()
+        self._closures.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def __validate(self):
+        if self._cache_version != self._version:
+            self._results.clear()
+            self._closures.clear()
+            self._cache_version = self._version
+
+    def __cached(self, name, compute):
+        self.__validate()
+        if name in self._results:
+            self._hits += 1
+            return self._results[name]
+        self._misses += 1
+        result = compute()
+        self._results[name] = result
+        return result
+
+    ########################
+    ##  Cached Operations ##
+    ########################
+
+    def is_regular(self):
+        return self.__cached("is_regular", lambda: Graph.is_regular(self))
+
+    def is_complete(self):
+        return self.__cached("is_complete", lambda: Graph.is_complete(self))
+
+    def is_tree(self):
+        return self.__cached("is_tree", lambda: Graph.is_tree(self))
+
+    def is_connected(self):
+        return self.__cached("is_connected", lambda: Graph.is_connected(self))
+
+    def transitive_closure(self, vertex):
+        """ Same as Graph.transitive_closure, but the result is served from a LRU cache. """
+        self.__validate()
+        if vertex in self._closures:
+            self._hits += 1
+            self._closures.move_to_end(vertex)
+            return set(self._closures[vertex])
+        self._misses += 1
+        result = frozenset(Graph.transitive_closure(self, vertex))
+        self._closures[vertex] = result
+        if len(self._closures) > self._maxsize:
+            self._closures.popitem(last=False)
+        return set(result)
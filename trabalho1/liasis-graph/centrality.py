@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+"""
+Centrality measures for Graph / Digraph.
+
+Every function converts the graph to its CSR representation (see csr.py) once
+and then works on integer indexes and flat arrays, which is much faster than
+walking the dictionary of sets. Results are dictionaries vertex -> score.
+
+    ranks = pagerank(graph)
+    best = max(ranks, key=ranks.get)
+
+Betweenness and closeness run one breadth-first search per source vertex.
+Both accept *processes*, the number of worker processes the sources are
+split across (None runs everything in the current process).
+
+=========================================
+
+Functions:
+
+    dict degree_centrality(graph)
+    dict pagerank(graph, damping, tolerance, max_iterations)
+    dict betweenness(graph, samples, seed, processes)
+    dict closeness(graph, vertices, processes)
+
+=========================================
+
+@license: MIT License
+"""
+
+import collections
+import random
+import workers
+from csr import CSR
+
+def degree_centrality(graph):
+    """ Return the degree of every vertex divided by n - 1.
+
+    For a digraph the in-degree is used, computed for every vertex in a single
+    pass over the arcs (Graph.in_degree scans the whole graph for each vertex).
+
+    :param graph: The graph.
+    :return A dictionary vertex -> centrality.
+    """
+    matrix = CSR.from_graph(graph)
+    if matrix.digraph:
+        matrix = matrix.reverse()
+    scale = 1.0 / (matrix.order() - 1) if matrix.order() > 1 else 0.0
+    return matrix.to_dict(d * scale for d in matrix.degrees())
+
+def pagerank(graph, damping=0.85, tolerance=1.0e-6, max_iterations=100):
+    """ Return the PageRank of every vertex, by power iteration.
+
+    Vertices without sucessors spread their rank uniformly over every vertex.
+    Iteration stops when the sum of the absolute rank changes is below
+    *tolerance*, or after *max_iterations*.
+
+    :param graph: The graph (for a not directed graph every edge counts in both directions).
+    :param damping: Probability of following an edge instead of jumping to a random vertex.
+    :param tolerance: Convergence threshold on the L1 change between two iterations.
+    :param max_iterations: Maximum number of iterations.
+    :return A dictionary vertex -> rank. The ranks sum to 1.
+    """
+    matrix = CSR.from_graph(graph)
+    n = matrix.order()
+    if n == 0:
+        return {}
+    incoming = matrix.reverse()
+    offsets, targets = incoming.offsets, incoming.targets
+    out_degree = matrix.degrees()
+    dangling = [i for i in range(n) if out_degree[i] == 0]
+    inverse = [1.0 / d if d else 0.0 for d in out_degree]
+
+    rank = [1.0 / n] * n
+    for _ in range(max_iterations):
+        contribution = list(map(float.__mul__, rank, inverse))
+        share = contribution.__getitem__
+        base = (1.0 - damping) / n + damping * sum(rank[i] for i in dangling) / n
+        new_rank = [base + damping * sum(map(share, targets[offsets[i]:offsets[i + 1]]))
+                    for i in range(n)]
+        change = sum(abs(a - b) for a, b in zip(new_rank, rank))
+        rank = new_rank
+        if change < tolerance:
+            break
+    return matrix.to_dict(rank)
+
+#############################
+##  Breadth-first searches ##
+#############################
+
+def _bfs(matrix, source):
+    offsets, targets = matrix.offsets, matrix.targets
+    distance = {source: 0}
+    order = []
+    paths = {source: 1}
+    parents = collections.defaultdict(list)
+    queue = collections.deque([source])
+    while queue:
+        v = queue.popleft()
+        order.append(v)
+        next_distance = distance[v] + 1
+        for j in range(offsets[v], offsets[v + 1]):
+            u = targets[j]
+            if u not in distance:
+                distance[u] = next_distance
+                paths[u] = 0
+                queue.append(u)
+            if distance[u] == next_distance:
+                paths[u] += paths[v]
+                parents[u].append(v)
+    return order, distance, paths, parents
+
+def _betweenness_from(matrix, sources):
+    scores = collections.defaultdict(float)
+    for source in sources:
+        order, _, paths, parents = _bfs(matrix, source)
+        dependency = dict.fromkeys(order, 0.0)
+        for w in reversed(order):
+            coefficient = (1.0 + dependency[w]) / paths[w]
+            for v in parents[w]:
+                dependency[v] += paths[v] * coefficient
+            if w != source:
+                scores[w] += dependency[w]
+    return scores
+
+def _closeness_of(matrix, indexes):
+    n = matrix.order()
+    result = {}
+    for i in indexes:
+        _, distance, _, _ = _bfs(matrix, i)
+        total = sum(distance.values())
+        reached = len(distance) - 1
+        if total > 0 and n > 1:
+            result[i] = (reached / float(total)) * (reached / float(n - 1))
+        else:
+            result[i] = 0.0
+    return result
+
+def _task(task):
+    function, items = task
+    return function(workers.state, items)
+
+def _run(matrix, function, items, processes):
+    if not processes:
+        return [function(matrix, items)]
+    with workers.pool(processes, matrix) as pool:
+        tasks = [(function, chunk) for chunk in workers.chunks(items, processes * 4)]
+        return list(pool.map(_task, tasks))
+
+def betweenness(graph, samples=None, seed=None, processes=None):
+    """ Return the (approximate) betweenness centrality of every vertex.
+
+    Uses Brandes' algorithm. When *samples* is given, only that many random
+    source vertices are used and the result is scaled by n / samples, which is
+    an unbiased estimate of the exact value.
+
+    :param graph: The graph.
+    :param samples: Number of sampled sources, or None to use every vertex (exact).
+    :param seed: Seed for the choice of the sampled sources.
+    :param processes: Number of worker processes, or None to run in this process.
+    :return A dictionary vertex -> betweenness.
+    """
+    matrix = CSR.from_graph(graph)
+    n = matrix.order()
+    sources = list(range(n))
+    if samples is not None and samples < n:
+        sources = random.Random(seed).sample(sources, samples)
+    scale = n / float(len(sources)) if sources else 0.0
+    if not matrix.digraph:
+        scale /= 2.0
+
+    scores = [0.0] * n
+    for partial in _run(matrix, _betweenness_from, sources, processes):
+        for i, value in partial.items():
+            scores[i] += value
+    return matrix.to_dict(s * scale for s in scores)
+
+def closeness(graph, vertices=None, processes=None):
+    """ Return the closeness centrality of the given vertices.
+
+    Closeness is (r / total distance) * (r / (n - 1)), where r is the number of
+    vertices reachable from the vertex, so vertices in small components don't
+    get a high score. For a digraph the distances to the sucessors are used.
+
+    :param graph: The graph.
+    :param vertices: The vertices to be measured, or None for every vertex.
+    :param processes: Number of worker processes, or None to run in this process.
+    :return A dictionary vertex -> closeness.
+    """
+    matrix = CSR.from_graph(graph)
+    if vertices is None:
+        indexes = list(range(matrix.order()))
+    else:
+        indexes = [matrix.index[v] for v in vertices if v in matrix.index]
+    result = {}
+    for partial in _run(matrix, _closeness_of, indexes, processes):
+        for i, value in partial.items():
+            result[matrix.vertices[i]] = value
+    return result
@@ -0,0 +1,277 @@
+#!/usr/bin/env python
+"""
+Community detection for not directed graphs.
+
+Two algorithms, both working on the integer indexes of the CSR representation
+(see csr.py):
+
+    label_propagation: every vertex repeatedly takes the label shared by most of
+    its neighbours, visiting the vertices in a random order each round, until
+    no label changes. Very fast, no quality guarantee.
+
+    louvain: greedy modularity optimisation. Vertices are moved to the
+    neighbouring community with the best modularity gain until nothing improves,
+    then each community is collapsed into a single vertex and the process is
+    repeated on the smaller graph.
+
+Both return a partition: a pair (vertices, labels) where *vertices* is the list
+of vertices and *labels* an array('l') with the community of each of them,
+numbered from 0. Use communities() to turn it into a list of sets.
+
+With *processes*, the vertices are split in ranges handled by a process pool,
+and the labels / communities live in shared memory (see workers.py), so a
+round only ships a range to each worker and gets back a count or a list of
+vertices. Label propagation updates the shared labels directly (it is
+asynchronous anyway). Louvain's workers find, for its first (largest) level,
+the vertices that would gain by moving; this process then moves them one by
+one, checking each move against the ones already made, so the modularity
+never decreases, until no worker finds any.
+
+=========================================
+
+Functions:
+
+    partition label_propagation(graph, seed, max_iterations, processes)
+    partition louvain(graph, seed, processes)
+    float modularity(graph, partition)
+    list(set(vertex)) communities(partition)
+
+=========================================
+
+@license: MIT License
+"""
+
+import random
+import workers
+from array import array
+from csr import CSR
+
+def _matrix(graph):
+    if graph._digraph:
+        raise NotImplementedError
+    return CSR.from_graph(graph)
+
+def _normalize(labels):
+    numbers = {}
+    return array("l", (numbers.setdefault(label, len(numbers)) for label in labels))
+
+def communities(partition):
+    """ Return the communities of a partition as a list of sets of vertices.
+
+    :param partition: A pair (vertices, labels).
+    :return A list of sets, the one at index i holding the vertices labelled i.
+    """
+    vertices, labels = partition
+    groups = [set() for _ in range(max(labels) + 1)] if labels else []
+    for vertex, label in zip(vertices, labels):
+        groups[label].add(vertex)
+    return groups
+
+def modularity(graph, partition):
+    """ Return the modularity of a partition of *graph*.
+
+    :param graph: A not directed graph.
+    :param partition: A pair (vertices, labels), as returned by the functions of this module.
+    :return A float between -1/2 and 1.
+    """
+    matrix = _matrix(graph)
+    vertices, labels = partition
+    label = dict(zip(vertices, labels))
+    inside = {}
+    total = {}
+    m2 = 0
+    for i in range(matrix.order()):
+        c = label[matrix.vertices[i]]
+        neighbours = matrix.neighbours(i)
+        m2 += len(neighbours)
+        total[c] = total.get(c, 0) + len(neighbours)
+        for j in neighbours:
+            if label[matrix.vertices[j]] == c:
+                inside[c] = inside.get(c, 0) + 1
+    if m2 == 0:
+        return 0.0
+    return sum(inside.get(c, 0) / float(m2) - (total[c] / float(m2)) ** 2 for c in total)
+
+#########################
+##  Label Propagation  ##
+#########################
+
+def _propagate(order, labels, offsets, targets, rnd):
+    changed = 0
+    for v in order:
+        counts = {}
+        for j in range(offsets[v], offsets[v + 1]):
+            u = targets[j]
+            if u != v:
+                label = labels[u]
+                counts[label] = counts.get(label, 0) + 1
+        if not counts:
+            continue
+        best = max(counts.values())
+        if counts.get(labels[v], 0) == best:
+            continue
+        candidates = [label for label, count in counts.items() if count == best]
+        labels[v] = candidates[0] if len(candidates) == 1 else rnd.choice(candidates)
+        changed += 1
+    return changed
+
+def _propagate_range(task):
+    start, stop, seed = task
+    offsets, targets, labels = workers.state
+    rnd = random.Random(seed)
+    order = list(range(start, stop))
+    rnd.shuffle(order)
+    return _propagate(order, workers.view(labels), offsets, targets, rnd)
+
+def label_propagation(graph, seed=None, max_iterations=100, processes=None):
+    """ Find communities by asynchronous label propagation.
+
+    :param graph: A not directed graph.
+    :param seed: Seed for the visiting order and the tie breaks.
+    :param max_iterations: Maximum number of rounds over every vertex.
+    :param processes: Number of worker processes, or None to run in this process.
+    :return A partition (vertices, labels).
+    """
+    matrix = _matrix(graph)
+    n = matrix.order()
+    offsets, targets = matrix.offsets, matrix.targets
+    rnd = random.Random(seed)
+    labels = array("l", range(n))
+    order = list(range(n))
+
+    if not processes:
+        for _ in range(max_iterations):
+            rnd.shuffle(order)
+            if not _propagate(order, labels, offsets, targets, rnd):
+                break
+        return matrix.vertices, _normalize(labels)
+
+    shared = workers.shared_array("l", labels)
+    with workers.pool(processes, (offsets, targets, shared)) as pool:
+        ranges = workers.ranges(n, processes)
+        for _ in range(max_iterations):
+            tasks = [(start, stop, rnd.random()) for start, stop in ranges]
+            if not sum(pool.map(_propagate_range, tasks)):
+                break
+    return matrix.vertices, _normalize(workers.view(shared))
+
+###############
+##  Louvain  ##
+###############
+
+def _best_community(i, adjacency, degree, community, total, m2):
+    ki = degree[i]
+    current = community[i]
+    weights = {}
+    for j, w in adjacency[i].items():
+        if j != i:
+            c = community[j]
+            weights[c] = weights.get(c, 0) + w
+    best = current
+    best_gain = weights.get(current, 0) - (total[current] - ki) * ki / m2
+    for c, w in weights.items():
+        if c != current:
+            gain = w - total[c] * ki / m2
+            if gain > best_gain + 1.0e-12:
+                best, best_gain = c, gain
+    return best
+
+def _move(i, target, degree, community, total):
+    total[community[i]] -= degree[i]
+    total[target] += degree[i]
+    community[i] = target
+
+def _local_moving(adjacency, degree, community, total, m2, rnd):
+    order = list(range(len(adjacency)))
+    moved = True
+    while moved:
+        moved = False
+        rnd.shuffle(order)
+        for i in order:
+            best = _best_community(i, adjacency, degree, community, total, m2)
+            if best != community[i]:
+                _move(i, best, degree, community, total)
+                moved = True
+
+def _candidates(task):
+    start, stop = task
+    adjacency, degree, m2, community, total, dirty = workers.state
+    community, total, dirty = workers.view(community), workers.view(total), workers.view(dirty)
+    found = []
+    for i in range(start, stop):
+        if dirty[i]:
+            dirty[i] = 0
+            if _best_community(i, adjacency, degree, community, total, m2) != community[i]:
+                found.append(i)
+    return found
+
+def _parallel_moving(adjacency, degree, community, total, m2, processes, rnd):
+    # Only the vertices marked dirty (every vertex at first, then the neighbours of
+    # the vertices moved in the previous round) are checked again, as in the fast
+    # local moving of the Leiden algorithm.
+    shared_community = workers.shared_array("l", community)
+    shared_total = workers.shared_array("d", total)
+    shared_dirty = workers.shared_array("b", [1] * len(adjacency))
+    state = (adjacency, degree, m2, shared_community, shared_total, shared_dirty)
+    community_view, total_view, dirty = [workers.view(a) for a in (shared_community, shared_total, shared_dirty)]
+    with workers.pool(processes, state) as pool:
+        ranges = workers.ranges(len(adjacency), processes)
+        while True:
+            candidates = [i for found in pool.map(_candidates, ranges) for i in found]
+            if not candidates:
+                break
+            rnd.shuffle(candidates)
+            for i in candidates:
+                best = _best_community(i, adjacency, degree, community_view, total_view, m2)
+                if best != community_view[i]:
+                    _move(i, best, degree, community_view, total_view)
+                    for j in adjacency[i]:
+                        dirty[j] = 1
+    community[:] = community_view
+    total[:] = total_view
+
+def _aggregate(adjacency, community):
+    numbers = {}
+    for c in community:
+        numbers.setdefault(c, len(numbers))
+    aggregated = [{} for _ in range(len(numbers))]
+    for i, neighbours in enumerate(adjacency):
+        a = aggregated[numbers[community[i]]]
+        for j, w in neighbours.items():
+            c = numbers[community[j]]
+            a[c] = a.get(c, 0) + w
+    return aggregated, [numbers[c] for c in community]
+
+def louvain(graph, seed=None, processes=None):
+    """ Find communities with the Louvain modularity optimisation.
+
+    :param graph: A not directed graph.
+    :param seed: Seed for the order the vertices are visited.
+    :param processes: Number of worker processes for the first level, or None to
+                      run in this process.
+    :return A partition (vertices, labels).
+    """
+    matrix = _matrix(graph)
+    n = matrix.order()
+    rnd = random.Random(seed)
+    adjacency = [dict.fromkeys(matrix.neighbours(i), 1) for i in range(n)]
+    membership = list(range(n))
+
+    level = 0
+    while True:
+        degree = [sum(neighbours.values()) for neighbours in adjacency]
+        m2 = float(sum(degree))
+        if m2 == 0:
+            break
+        community = list(range(len(adjacency)))
+        total = degree[:]
+        if processes and level == 0:
+            _parallel_moving(adjacency, degree, community, total, m2, processes, rnd)
+        else:
+            _local_moving(adjacency, degree, community, total, m2, rnd)
+        adjacency, renumbered = _aggregate(adjacency, community)
+        membership = [renumbered[c] for c in membership]
+        if len(adjacency) == len(community):
+            break
+        level += 1
+    return matrix.vertices, _normalize(membership)
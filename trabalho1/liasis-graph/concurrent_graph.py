@@ -0,0 +1,348 @@
+#!/usr/bin/env python
+"""
+A thread-safe Graph / Digraph for many readers and a single writer.
+
+Readers never take a lock: every query runs against an immutable snapshot (a
+regular Graph whose adjacency sets are frozensets) that is published by a
+single attribute assignment. Writers are serialized by a lock, apply their
+changes to a copy-on-write version of the current snapshot and then swap the
+new snapshot in atomically. A reader that already holds a snapshot keeps
+seeing it unchanged, even while new versions are published.
+
+Snapshots don't copy the whole dictionary of vertices either: each one is a
+small overlay (the vertices changed since the last compaction, plus the ones
+removed) on top of a base dictionary shared by many versions. A writer
+copies only the overlay, and the overlay is merged into a new base once it
+outgrows about sqrt(V) entries. So a write costs O(sqrt(V)) plus what it
+touches (amortized), instead of O(V). Reads on a snapshot with an overlay go
+through Python code (two dictionary lookups instead of one); a freshly
+compacted snapshot, or one that was never written to, holds a plain dict.
+
+Once the fingerprint of a snapshot has been computed, writers carry it over
+to the next snapshots (see Graph.fingerprint), so publishing never costs
+O(V + E) just to keep it.
+
+    graph = ConcurrentGraph()
+    with graph.batch() as writer:
+        writer.add("a")
+        writer.add("b")
+        writer.connect("a", "b")
+
+    graph.adjacents_to("a")     # frozenset(["b"])
+    snapshot = graph.snapshot() # consistent view for several queries
+
+=========================================
+
+Read methods (lock free):
+
+    Graph snapshot()
+    int version()
+    set(vertex) vertices()
+    vertex random()
+    set(vertex) sucessors(vertex)
+    set(vertex) predecessors(vertex)
+    set(vertex) adjacents_to(vertex)
+    int order()
+    int degree(vertex)
+    int in_degree(vertex)
+    int out_degree(vertex)
+    int fingerprint()
+
+Write methods (serialized):
+
+    batch()
+    void add(vertex)
+    void remove(vertex)
+    void connect(vertexA, vertexB)
+    void disconnect(vertexA, vertexB)
+
+=========================================
+
+@license: MIT License
+"""
+
+import contextlib
+import threading
+from collections.abc import MutableMapping
+from graph import ReadOnlyGraph, FINGERPRINT_MASK, _vertex_hash, _arc_hash
+from graph_exceptions import ReadOnlyGraphError
+
+class Overlay(MutableMapping):
+    """ Dictionary of vertices made of a shared base and the changes made on top of it.
+
+    Writers build one on top of the current snapshot. The base is never changed. *delta* holds the vertices added or changed since the
+    base was built and *removed* the vertices of the base that were removed.
+    """
+
+    def __init__(self, base, delta=None, removed=None, size=None):
+        self._base = base
+        self._delta = delta if delta is not None else {}
+        self._removed = removed if removed is not None else set()
+        self._size = size if size is not None else len(base)
+
+    def __getitem__(self, vertex):
+        if vertex in self._delta:
+            return self._delta[vertex]
+        if vertex in self._removed:
+            raise KeyError(vertex)
+        return self._base[vertex]
+
+    def __contains__(self, vertex):
+        return vertex in self._delta or (vertex not in self._removed and vertex in self._base)
+
+    def __iter__(self):
+        delta, removed = self._delta, self._removed
+        for vertex in delta:
+            yield vertex
+        for vertex in self._base:
+            if vertex not in delta and vertex not in removed:
+                yield vertex
+
+    def __len__(self):
+        return self._size
+
+    def __setitem__(self, vertex, neighbours):
+        if vertex not in self:
+            self._size += 1
+        self._delta[vertex] = neighbours
+
+    def __delitem__(self, vertex):
+        if vertex not in self:
+            raise KeyError(vertex)
+        self._delta.pop(vertex, None)
+        if vertex in self._base:
+            self._removed.add(vertex)
+        self._size -= 1
+
+    @classmethod
+    def over(cls, vertices):
+        """ Return a new Overlay on top of *vertices* (a dict or an Overlay), copying only the changes. """
+        if isinstance(vertices, Overlay):
+            return cls(vertices._base, dict(vertices._delta), set(vertices._removed), vertices._size)
+        return cls(vertices)
+
+    def compacted(self):
+        """ Return self, or a plain dict with the same vertices once the changes are too many. """
+        if len(self._delta) + len(self._removed) <= max(64, int(len(self._base) ** 0.5)):
+            return self
+        vertices = dict(self._base)
+        for vertex in self._removed:
+            del vertices[vertex]
+        vertices.update(self._delta)
+        return vertices
+
+class Snapshot(ReadOnlyGraph):
+    """ An immutable version of a graph, as published by ConcurrentGraph. """
+
+    def __init__(self, vertices, digraph, version):
+        ReadOnlyGraph.__init__(self, vertices, digraph)
+        self._version = version
+
+class Writer(object):
+    """ Applies mutations on top of a snapshot, copying only what it touches.
+
+    A writer is closed when its batch ends: the published snapshot shares its
+    dictionary of vertices, so any later mutation raises ReadOnlyGraphError.
+    """
+
+    def __init__(self, snapshot):
+        self._digraph = snapshot._digraph
+        self._version = snapshot.version()
+        self._vertices = Overlay.over(snapshot._vertices)
+        self._touched = set()
+        self._changed = False
+        self._fingerprint = snapshot._fingerprint
+        self._closed = False
+
+    def add(self, vertex):
+        """ Add a vertice to the new version. Same semantics as Graph.add. """
+        self.__check()
+        if vertex not in self._vertices:
+            self._vertices[vertex] = set()
+            self._touched.add(vertex)
+            self._changed = True
+            self.__rehash(_vertex_hash(vertex))
+
+    def remove(self, vertex):
+        """ Remove a vertice from the new version. Same semantics as Graph.remove. """
+        self.__check()
+        if vertex in self._vertices:
+            if self._digraph:
+                candidates = list(self._vertices)
+            else:
+                candidates = list(self._vertices[vertex])
+            for v in candidates:
+                if v != vertex and vertex in self._vertices[v]:
+                    self.__mutable(v).remove(vertex)
+                    self.__rehash(-_arc_hash(v, vertex))
+            if self._fingerprint is not None:
+                self.__rehash(-_vertex_hash(vertex) - sum(_arc_hash(vertex, u) for u in self._vertices[vertex]))
+            del self._vertices[vertex]
+            self._touched.discard(vertex)
+            self._changed = True
+
+    def connect(self, vertexA, vertexB):
+        """ Connect vertexA to vertexB in the new version. Same semantics as Graph.connect. """
+        self.__check()
+        if (vertexA in self._vertices) and (vertexB in self._vertices):
+            if vertexB not in self._vertices[vertexA]:
+                self.__mutable(vertexA).add(vertexB)
+                self._changed = True
+                self.__rehash(_arc_hash(vertexA, vertexB))
+            if not self._digraph and vertexA not in self._vertices[vertexB]:
+                self.__mutable(vertexB).add(vertexA)
+                self._changed = True
+                self.__rehash(_arc_hash(vertexB, vertexA))
+
+    def disconnect(self, vertexA, vertexB):
+        """ Disconnect vertexA to vertexB in the new version. Same semantics as Graph.disconnect. """
+        self.__check()
+        if (vertexA in self._vertices) and (vertexB in self._vertices):
+            if vertexB in self._vertices[vertexA]:
+                self.__mutable(vertexA).remove(vertexB)
+                self.__rehash(-_arc_hash(vertexA, vertexB))
+                if not self._digraph and vertexA in self._vertices[vertexB]:
+                    self.__mutable(vertexB).remove(vertexA)
+                    self.__rehash(-_arc_hash(vertexB, vertexA))
+                self._changed = True
+
+    def publishable(self):
+        """ Return a new Snapshot with the changes, or None if nothing changed. """
+        if not self._changed:
+            return None
+        for vertex in self._touched:
+            self._vertices[vertex] = frozenset(self._vertices[vertex])
+        snapshot = Snapshot(self._vertices.compacted(), self._digraph, self._version + 1)
+        snapshot._fingerprint = self._fingerprint
+        return snapshot
+
+    def close(self):
+        """ Refuse any further mutation (called at the end of the batch). """
+        self._closed = True
+
+    def __check(self):
+        if self._closed:
+            raise ReadOnlyGraphError("This writer's batch is over, start a new batch.")
+
+    def __rehash(self, delta):
+        if self._fingerprint is not None:
+            self._fingerprint = (self._fingerprint + delta) & FINGERPRINT_MASK
+
+    def __mutable(self, vertex):
+        if vertex not in self._touched:
+            self._vertices[vertex] = set(self._vertices[vertex])
+            self._touched.add(vertex)
+        return self._vertices[vertex]
+
+class ConcurrentGraph(object):
+
+    def __init__(self, vertices=None, digraph=False):
+        """ Creates a new concurrent graph.
+
+        :param vertices: A dictionary of vertices to be setted as vertices for the new graph.
+                         The dictionary is copied, so later changes to it aren't seen.
+        :param digraph: True if the graph is a directed graph. Defaults to false.
+        :return None
+        """
+        vertices = vertices or {}
+        frozen = dict((v, frozenset(vertices[v])) for v in vertices)
+        self._snapshot = Snapshot(frozen, digraph, 0)
+        self._write_lock = threading.Lock()
+        self._local = threading.local()
+
+    ######################
+    ##  Read Operations ##
+    ######################
+
+    def snapshot(self):
+        """ Return the current published version of the graph.
+
+        The returned Snapshot is a read-only Graph and never changes, so it can be
+        used for a sequence of queries that must see the same version.
+
+        :return A Snapshot.
+        """
+        return self._snapshot
+
+    def version(self):
+        """ Return the version of the current snapshot (incremented on every publish).
+
+        :return A integer representing the version.
+        """
+        return self._snapshot.version()
+
+    def vertices(self):
+        return self._snapshot.vertices()
+
+    def random(self):
+        return self._snapshot.random()
+
+    def sucessors(self, vertex):
+        return self._snapshot.sucessors(vertex)
+
+    def predecessors(self, vertex):
+        return self._snapshot.predecessors(vertex)
+
+    def adjacents_to(self, vertex):
+        return self._snapshot.adjacents_to(vertex)
+
+    def order(self):
+        return self._snapshot.order()
+
+    def degree(self, vertex):
+        return self._snapshot.degree(vertex)
+
+    def in_degree(self, vertex):
+        return self._snapshot.in_degree(vertex)
+
+    def out_degree(self, vertex):
+        return self._snapshot.out_degree(vertex)
+
+    def fingerprint(self):
+        return self._snapshot.fingerprint()
+
+    #######################
+    ##  Write Operations ##
+    #######################
+
+    @contextlib.contextmanager
+    def batch(self):
+        """ Apply a group of mutations and publish them as a single new version.
+
+        Only one batch runs at a time. Readers keep using the previous snapshot until
+        the batch ends; if the block raises an exception nothing is published.
+        A batch (or add, remove...) started by the thread that is already inside a
+        batch joins it: its changes are published with the outer batch.
+
+        :return A Writer, with add/remove/connect/disconnect methods.
+        """
+        writer = getattr(self._local, "writer", None)
+        if writer is not None:
+            yield writer
+            return
+        with self._write_lock:
+            writer = self._local.writer = Writer(self._snapshot)
+            try:
+                yield writer
+                snapshot = writer.publishable()
+                if snapshot is not None:
+                    self._snapshot = snapshot
+            finally:
+                writer.close()
+                self._local.writer = None
+
+    def add(self, vertex):
+        with self.batch() as writer:
+            writer.add(vertex)
+
+    def remove(self, vertex):
+        with self.batch() as writer:
+            writer.remove(vertex)
+
+    def connect(self, vertexA, vertexB):
+        with self.batch() as writer:
+            writer.connect(vertexA, vertexB)
+
+    def disconnect(self, vertexA, vertexB):
+        with self.batch() as writer:
+            writer.disconnect(vertexA, vertexB)
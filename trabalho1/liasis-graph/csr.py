@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+"""
+Compressed sparse row (CSR) representation of a Graph.
+
+Numeric algorithms (centrality, clustering, communities...) work much faster
+on integers and flat arrays than on vertex labels and Python sets. CSR gives
+every vertex an integer index (0..n-1) and stores all adjacency lists one
+after the other in a single array:
+
+    neighbours of vertex i = targets[offsets[i]:offsets[i + 1]]
+
+Both arrays are 'array.array' of machine integers, so a graph with millions
+of edges takes a few bytes per edge instead of a Python object per edge.
+
+For a not directed graph every edge appears twice (once in each direction),
+for a digraph the arrays hold the sucessors of each vertex; reverse() builds
+the predecessors.
+
+=========================================
+
+@license: MIT License
+"""
+
+from array import array
+
+class CSR(object):
+
+    def __init__(self, vertices, offsets, targets, digraph):
+        """ Creates a CSR from its arrays. See from_graph to build one from a Graph.
+
+        :param vertices: A list with the vertex of each index.
+        :param offsets: An array of n + 1 integers.
+        :param targets: An array with the indexes of the neighbours of each vertex.
+        :param digraph: True if the arrays hold a directed graph.
+        :return None
+        """
+        self.vertices = vertices
+        self.index = dict((v, i) for i, v in enumerate(vertices))
+        self.offsets = offsets
+        self.targets = targets
+        self.digraph = digraph
+
+    @classmethod
+    def from_graph(cls, graph):
+        """ Build the CSR of *graph* (a Graph, a subgraph view or a snapshot).
+
+        :param graph: The graph to be converted.
+        :return A CSR.
+        """
+        vertices = list(graph._vertices)
+        index = dict((v, i) for i, v in enumerate(vertices))
+        offsets = array("l", [0])
+        targets = array("l")
+        for v in vertices:
+            targets.extend(index[u] for u in graph._vertices[v] if u in index)
+            offsets.append(len(targets))
+        return cls(vertices, offsets, targets, graph._digraph)
+
+    def order(self):
+        """ Return the number of vertices. """
+        return len(self.vertices)
+
+    def size(self):
+        """ Return the number of entries in targets (twice the edges of a not directed graph). """
+        return len(self.targets)
+
+    def neighbours(self, i):
+        """ Return the indexes adjacent to (or sucessors of) index *i*. """
+        return self.targets[self.offsets[i]:self.offsets[i + 1]]
+
+    def degrees(self):
+        """ Return an array with the (out) degree of every index. """
+        offsets = self.offsets
+        return array("l", (offsets[i + 1] - offsets[i] for i in range(len(self.vertices))))
+
+    def reverse(self):
+        """ Return the CSR with every arc reversed (the predecessors of each index).
+
+        For a not directed graph the CSR is its own reverse and is returned as is.
+
+        :return A CSR.
+        """
+        if not self.digraph:
+            return self
+        n = len(self.vertices)
+        counts = [0] * (n + 1)
+        for t in self.targets:
+            counts[t + 1] += 1
+        for i in range(n):
+            counts[i + 1] += counts[i]
+        offsets = array("l", counts)
+        position = counts[:-1]
+        targets = array("l", bytes(len(self.targets) * array("l").itemsize))
+        for i in range(n):
+            for j in range(self.offsets[i], self.offsets[i + 1]):
+                t = self.targets[j]
+                targets[position[t]] = i
+                position[t] += 1
+        return CSR(self.vertices, offsets, targets, True)
+
+    def to_dict(self, values):
+        """ Map a sequence indexed like the vertices back to a dictionary vertex -> value. """
+        return dict(zip(self.vertices, values))
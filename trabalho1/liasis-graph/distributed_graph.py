@@ -0,0 +1,234 @@
+#!/usr/bin/env python
+"""
+A Graph / Digraph partitioned across worker processes.
+
+PartitionedGraph splits the vertices of a Graph (with their adjacency sets)
+across N worker processes, by a hash of the vertex value (see
+external_graph.shard_of, the same in every process) or by ranges of sorted
+vertices. Traversals are level synchronous: at each level every worker expands
+the frontier vertices it owns, keeps the neighbours it owns itself and sends
+the other ones straight to their owners' inboxes, then reads its own inbox to
+build its next frontier. A worker never sends the same vertex twice, and
+neighbours it already visited never leave it. The coordinator only starts
+each level and adds up the sizes of the new frontiers.
+
+Each worker finds the owners of the neighbours of its vertices once, when it
+starts, so a traversal doesn't hash any vertex.
+
+    with PartitionedGraph(graph, workers=4) as partitioned:
+        levels = partitioned.bfs("a")     # {vertex: distance from "a"}
+        partitioned.is_connected()
+
+=========================================
+
+Methods:
+
+    int order()
+    int owner(vertex)
+    dict bfs(vertex)
+    bool is_connected()
+    void close()
+
+=========================================
+
+@license: MIT License
+"""
+
+import bisect
+import multiprocessing
+from external_graph import shard_of
+
+class Partitioner(object):
+    """ Decides which worker owns each vertex. """
+
+    def __init__(self, workers, partition="hash", vertices=()):
+        """ Creates a partitioner.
+
+        :param workers: Number of workers.
+        :param partition: "hash" (hash of the vertex value, see external_graph.shard_of:
+                          vertices must be numbers, strings, bytes, None or tuples of them)
+                          or "range" (ranges of sorted vertices, which must be comparable).
+        :param vertices: The vertices of the graph, needed by "range" to compute the bounds.
+        :return None
+        """
+        if partition not in ("hash", "range"):
+            raise ValueError("Unknown partition: %r" % partition)
+        self.workers = workers
+        self.partition = partition
+        self.bounds = []
+        if partition == "range":
+            ordered = sorted(vertices)
+            size = len(ordered) / float(workers)
+            self.bounds = [ordered[int(size * w)] for w in range(1, workers) if int(size * w) < len(ordered)]
+
+    def owner(self, vertex):
+        if self.partition == "hash":
+            return shard_of(vertex, self.workers)
+        return bisect.bisect_right(self.bounds, vertex)
+
+def _worker(connection, index, vertices, partitioner, inboxes):
+    # For every vertex: the neighbours owned by this worker, and the other ones
+    # with their owners.
+    local = {}
+    remote = {}
+    owners = {}
+    for v in vertices:
+        local[v] = []
+        remote[v] = []
+        for u in vertices[v]:
+            w = owners.get(u)
+            if w is None:
+                w = owners[u] = partitioner.owner(u)
+            if w == index:
+                local[v].append(u)
+            else:
+                remote[v].append((w, u))
+    owners = None
+    others = [w for w in range(len(inboxes)) if w != index]
+    levels = {}
+    sent = set()
+    frontier = []
+    while True:
+        message = connection.recv()
+        command = message[0]
+        if command == "start":
+            vertex = message[1]
+            levels = {}
+            sent = set()
+            frontier = []
+            if vertex in vertices and partitioner.owner(vertex) == index:
+                levels[vertex] = 0
+                frontier.append(vertex)
+            connection.send(len(frontier))
+        elif command == "step":
+            level = message[1] + 1
+            following = []
+            outgoing = dict((w, []) for w in others)
+            for v in frontier:
+                for u in local[v]:
+                    if u not in levels:
+                        levels[u] = level
+                        following.append(u)
+                for w, u in remote[v]:
+                    if u not in sent:
+                        sent.add(u)
+                        outgoing[w].append(u)
+            for w in others:
+                inboxes[w].put(outgoing[w])
+            for _ in others:
+                for u in inboxes[index].get():
+                    if u not in levels and u in vertices:
+                        levels[u] = level
+                        following.append(u)
+            frontier = following
+            connection.send(len(frontier))
+        elif command == "levels":
+            connection.send(levels)
+        elif command == "visited":
+            connection.send(len(levels))
+        elif command == "order":
+            connection.send(len(vertices))
+        elif command == "vertex":
+            connection.send((True, next(iter(vertices))) if vertices else (False, None))
+        elif command == "stop":
+            connection.close()
+            return
+
+class PartitionedGraph(object):
+
+    def __init__(self, graph, workers=2, partition="hash"):
+        """ Splits *graph* across *workers* processes and starts them.
+
+        :param graph: The Graph to be partitioned. It's copied into the workers, later
+                      changes to it aren't seen.
+        :param workers: Number of worker processes.
+        :param partition: "hash" or "range" (see Partitioner).
+        :return None
+        """
+        self._digraph = graph._digraph
+        self._partitioner = Partitioner(workers, partition, graph._vertices)
+        parts = [{} for _ in range(workers)]
+        for v in graph._vertices:
+            parts[self._partitioner.owner(v)][v] = set(graph._vertices[v])
+
+        self._connections = []
+        self._processes = []
+        self._inboxes = [multiprocessing.Queue() for _ in range(workers)]
+        for index, part in enumerate(parts):
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_worker,
+                                              args=(child, index, part, self._partitioner, self._inboxes))
+            process.daemon = True
+            process.start()
+            child.close()
+            self._connections.append(parent)
+            self._processes.append(process)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.close()
+
+    def close(self):
+        """ Stop the worker processes. """
+        for connection in self._connections:
+            try:
+                connection.send(("stop",))
+            except (EOFError, OSError):
+                pass
+            connection.close()
+        for process in self._processes:
+            process.join()
+        for inbox in self._inboxes:
+            inbox.close()
+        self._connections = []
+        self._processes = []
+        self._inboxes = []
+
+    def __ask(self, message):
+        for connection in self._connections:
+            connection.send(message)
+        return [connection.recv() for connection in self._connections]
+
+    def owner(self, vertex):
+        """ Return the index of the worker that owns *vertex*. """
+        return self._partitioner.owner(vertex)
+
+    def order(self):
+        """ Return the order of the graph. """
+        return sum(self.__ask(("order",)))
+
+    def __traverse(self, vertex):
+        frontier = sum(self.__ask(("start", vertex)))
+        level = 0
+        while frontier:
+            frontier = sum(self.__ask(("step", level)))
+            level += 1
+
+    def bfs(self, vertex):
+        """ Level-synchronous breadth-first search (following sucessors in a digraph).
+
+        :param vertex: The vertex where the search starts.
+        :return A dictionary vertex -> level (distance from *vertex*), empty if *vertex*
+                isn't in the graph.
+        """
+        self.__traverse(vertex)
+        levels = {}
+        for part in self.__ask(("levels",)):
+            levels.update(part)
+        return levels
+
+    def is_connected(self):
+        """ Check whether the (not directed) graph is connected, without collecting the levels.
+
+        :return True if every vertex is reachable from any other one.
+        """
+        if self._digraph:
+            raise NotImplementedError
+        order = self.order()
+        if order == 0:
+            return True
+        start = next(v for found, v in self.__ask(("vertex",)) if found)
+        self.__traverse(start)
+        return sum(self.__ask(("visited",))) == order
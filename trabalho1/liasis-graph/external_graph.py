@@ -0,0 +1,407 @@
+#!/usr/bin/env python
+"""
+An external-memory (out-of-core) Graph / Digraph, for graphs larger than RAM.
+
+The adjacency is split in *shards* by a hash of the vertex, and each shard is
+stored on disk as a segment file (a pickled dictionary vertex -> tuple of
+neighbours). Segments are loaded on demand into a LRU page cache whose size is
+bounded by *memory_budget*, in bytes of memory: build() measures the size of
+every segment once loaded (its dictionary, tuples and vertex objects, many
+times the size of the file) and stores it with the graph, so the cache knows
+what a segment will cost before reading it.
+
+The shard of a vertex is a CRC of a serialization of its value (not of its
+repr or its hash()), so it's the same in every process and for equal vertices
+such as 1, 1.0 and True. Vertices must therefore be numbers, strings, bytes,
+None or tuples / frozensets of them; other types raise TypeError.
+
+    graph = ExternalGraph.build("/data/graph", edges, shards=256)
+    graph = ExternalGraph("/data/graph", memory_budget=512 * 1024 * 1024)
+    graph.adjacents_to("a")
+    graph.bfs("a")
+    graph.last_query_stats()   # {'hits': ..., 'misses': ..., 'hit_rate': ..., 'bytes_read': ...}
+
+build() never holds the whole edge list in memory: edges are first spooled to
+one file per shard, then every shard is turned into its segment on its own, so
+only one shard has to fit in memory at a time.
+
+bfs() expands the frontier one level at a time and reads the segments it needs
+in shard order, prefetching the next segment from disk in a background thread
+while the current one is processed.
+
+The graph is read only. Only the set of vertices already visited by bfs (and
+the frontier) has to fit in memory.
+
+=========================================
+
+Read methods:
+
+    set(vertex) vertices()
+    set(vertex) sucessors(vertex)
+    set(vertex) predecessors(vertex)
+    set(vertex) adjacents_to(vertex)
+    int order()
+    int disk_size()
+    int memory_size()
+    int degree(vertex)
+    int in_degree(vertex)
+    int out_degree(vertex)
+    list(vertex) bfs(vertex)
+
+Statistics:
+
+    dict stats()
+    dict last_query_stats()
+    void reset_stats()
+
+=========================================
+
+@license: MIT License
+"""
+
+import collections
+import json
+import os
+import pickle
+import sys
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from graph_exceptions import NotDigraphError, DigraphError
+
+META = "meta.json"
+FORMAT = 1
+SPOOL_BATCH = 10000
+
+def _key(vertex):
+    """ Serialize *vertex* to bytes that only depend on its value (equal vertices, equal keys). """
+    if vertex is None:
+        return b"n"
+    if isinstance(vertex, (bool, int)):
+        return b"i%d" % vertex
+    if isinstance(vertex, float):
+        if vertex.is_integer():
+            return b"i%d" % int(vertex)
+        return b"f" + repr(vertex).encode("ascii")
+    if isinstance(vertex, complex):
+        if vertex.imag == 0:
+            return _key(vertex.real)
+        return b"c" + repr(vertex).encode("ascii")
+    if isinstance(vertex, str):
+        return b"s" + vertex.encode("utf-8", "surrogatepass")
+    if isinstance(vertex, bytes):
+        return b"b" + vertex
+    if isinstance(vertex, (tuple, frozenset)):
+        keys = [_key(v) for v in vertex]
+        if isinstance(vertex, frozenset):
+            keys.sort()
+        return (b"t" if isinstance(vertex, tuple) else b"z") + b"".join(b"%d:" % len(k) + k for k in keys)
+    raise TypeError("Can't shard a %s vertex: use numbers, strings, bytes, None or tuples / "
+                    "frozensets of them." % type(vertex).__name__)
+
+def shard_of(vertex, shards):
+    """ Return the shard of *vertex*. Stable across processes and equal for equal vertices. """
+    return zlib.crc32(_key(vertex)) % shards
+
+def _size_of(value):
+    size = sys.getsizeof(value)
+    if isinstance(value, (tuple, frozenset)):
+        size += sum(_size_of(item) for item in value)
+    return size
+
+def _loaded_size(segment):
+    """ Estimate the memory taken by a segment once loaded: the dictionary, its vertices and tuples. """
+    return sys.getsizeof(segment) + sum(_size_of(v) + _size_of(segment[v]) for v in segment)
+
+def _segment_path(directory, shard):
+    return os.path.join(directory, "segment-%05d.pickle" % shard)
+
+def _spool_path(directory, shard):
+    return os.path.join(directory, "spool-%05d.pickle" % shard)
+
+class ExternalGraph(object):
+
+    def __init__(self, directory, memory_budget=64 * 1024 * 1024):
+        """ Opens a graph previously written by ExternalGraph.build.
+
+        :param directory: The directory holding the segment files.
+        :param memory_budget: Maximum size, in bytes of memory, of the page cache (an
+                              estimate measured by build, see memory_size).
+        :return None
+        """
+        with open(os.path.join(directory, META)) as f:
+            meta = json.load(f)
+        if meta.get("format") != FORMAT:
+            raise ValueError("%s doesn't hold an ExternalGraph of format %d, build it again."
+                             % (directory, FORMAT))
+        self._directory = directory
+        self._digraph = meta["digraph"]
+        self._shards = meta["shards"]
+        self._order = meta["order"]
+        self._memory = meta["memory"]
+        self._memory_budget = memory_budget
+        self._cache = collections.OrderedDict()
+        self._cache_bytes = 0
+        self._sizes = {}
+        self._prefetcher = ThreadPoolExecutor(1)
+        self.reset_stats()
+
+    @classmethod
+    def build(cls, directory, edges, vertices=(), digraph=False, shards=64,
+              memory_budget=64 * 1024 * 1024):
+        """ Write a graph to *directory* and open it.
+
+        :param directory: The directory for the segment files (created if needed).
+        :param edges: An iterable of (vertexA, vertexB) pairs. For a not directed graph
+                      each pair connects both vertices in both directions.
+        :param vertices: An iterable of vertices to be added even without edges.
+        :param digraph: True if the graph is a directed graph. Defaults to false.
+        :param shards: Number of segment files.
+        :param memory_budget: Page cache budget of the opened graph.
+        :return An ExternalGraph.
+        """
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        spools = [open(_spool_path(directory, s), "wb") for s in range(shards)]
+        buffers = [[] for _ in range(shards)]
+
+        # A record is (vertex,) for a vertex alone or (vertex, neighbour) for an
+        # arc: None is a valid vertex, so it can't mean "no neighbour".
+        def spool(record):
+            s = shard_of(record[0], shards)
+            buffers[s].append(record)
+            if len(buffers[s]) >= SPOOL_BATCH:
+                pickle.dump(buffers[s], spools[s], pickle.HIGHEST_PROTOCOL)
+                buffers[s] = []
+
+        try:
+            for vertex in vertices:
+                spool((vertex,))
+            for vertexA, vertexB in edges:
+                spool((vertexA, vertexB))
+                spool((vertexB,) if digraph else (vertexB, vertexA))
+            for s in range(shards):
+                if buffers[s]:
+                    pickle.dump(buffers[s], spools[s], pickle.HIGHEST_PROTOCOL)
+        finally:
+            for f in spools:
+                f.close()
+
+        order = 0
+        memory = []
+        for s in range(shards):
+            adjacency = collections.defaultdict(set)
+            with open(_spool_path(directory, s), "rb") as f:
+                while True:
+                    try:
+                        batch = pickle.load(f)
+                    except EOFError:
+                        break
+                    for record in batch:
+                        neighbours = adjacency[record[0]]
+                        if len(record) == 2:
+                            neighbours.add(record[1])
+            segment = dict((v, tuple(adjacency[v])) for v in adjacency)
+            order += len(segment)
+            memory.append(_loaded_size(segment))
+            with open(_segment_path(directory, s), "wb") as f:
+                pickle.dump(segment, f, pickle.HIGHEST_PROTOCOL)
+            os.remove(_spool_path(directory, s))
+
+        with open(os.path.join(directory, META), "w") as f:
+            json.dump({"format": FORMAT, "digraph": digraph, "shards": shards, "order": order,
+                       "memory": memory}, f)
+        return cls(directory, memory_budget)
+
+    @classmethod
+    def from_graph(cls, directory, graph, shards=64, memory_budget=64 * 1024 * 1024):
+        """ Write an in-memory Graph to *directory* and open it. See build. """
+        edges = ((v, u) for v in graph._vertices for u in graph._vertices[v])
+        return cls.build(directory, edges, graph._vertices, graph._digraph, shards, memory_budget)
+
+    def close(self):
+        """ Drop the page cache and stop the prefetch thread. """
+        self._prefetcher.shutdown()
+        self._cache.clear()
+        self._cache_bytes = 0
+
+    ##################
+    ##  Page Cache  ##
+    ##################
+
+    def reset_stats(self):
+        """ Reset the cumulative and the last query statistics. """
+        self._stats = {"hits": 0, "misses": 0, "bytes_read": 0}
+        self._query = dict(self._stats)
+
+    def stats(self):
+        """ Return the cumulative page cache statistics.
+
+        :return A dictionary with "hits", "misses", "hit_rate", "bytes_read" (from disk)
+                and "cached_bytes" (the estimated memory taken by the page cache).
+        """
+        result = self.__with_rate(self._stats)
+        result["cached_bytes"] = self._cache_bytes
+        return result
+
+    def last_query_stats(self):
+        """ Return the page cache statistics of the last query.
+
+        :return A dictionary with "hits", "misses", "hit_rate" and "bytes_read".
+        """
+        return self.__with_rate(self._query)
+
+    def __with_rate(self, counters):
+        result = dict(counters)
+        total = counters["hits"] + counters["misses"]
+        result["hit_rate"] = counters["hits"] / float(total) if total else 0.0
+        return result
+
+    def __begin_query(self):
+        self._query = {"hits": 0, "misses": 0, "bytes_read": 0}
+
+    def __count(self, name, amount=1):
+        self._stats[name] += amount
+        self._query[name] += amount
+
+    def __read(self, shard):
+        with open(_segment_path(self._directory, shard), "rb") as f:
+            return f.read()
+
+    def __store(self, shard, data):
+        self.__count("misses")
+        self.__count("bytes_read", len(data))
+        segment = pickle.loads(data)
+        self._cache[shard] = segment
+        self._sizes[shard] = self._memory[shard]
+        self._cache_bytes += self._memory[shard]
+        while self._cache_bytes > self._memory_budget and len(self._cache) > 1:
+            evicted, _ = self._cache.popitem(last=False)
+            self._cache_bytes -= self._sizes.pop(evicted)
+        return segment
+
+    def __segment(self, shard):
+        if shard in self._cache:
+            self.__count("hits")
+            self._cache.move_to_end(shard)
+            return self._cache[shard]
+        return self.__store(shard, self.__read(shard))
+
+    def __segments(self, shards):
+        """ Yield (shard, segment) for *shards* in order, prefetching the next missing one. """
+        shards = sorted(shards)
+        missing = [s for s in shards if s not in self._cache]
+        pending = {}
+        if missing:
+            pending[missing[0]] = self._prefetcher.submit(self.__read, missing[0])
+        position = 0
+        for shard in shards:
+            if shard in pending:
+                position += 1
+                if position < len(missing):
+                    following = missing[position]
+                    pending[following] = self._prefetcher.submit(self.__read, following)
+                segment = self.__store(shard, pending.pop(shard).result())
+            else:
+                segment = self.__segment(shard)
+            yield shard, segment
+
+    def __neighbours(self, vertex):
+        segment = self.__segment(shard_of(vertex, self._shards))
+        if vertex in segment:
+            return set(segment[vertex])
+        return None
+
+    #######################
+    ##  Read Operations  ##
+    #######################
+
+    def order(self):
+        """ Return the order of the graph (stored in the metadata, no disk read). """
+        return self._order
+
+    def disk_size(self):
+        """ Return the total size, in bytes, of the segment files. """
+        return sum(os.path.getsize(_segment_path(self._directory, s)) for s in range(self._shards))
+
+    def memory_size(self):
+        """ Return the estimated memory, in bytes, taken by all the segments once loaded. """
+        return sum(self._memory)
+
+    def vertices(self):
+        """ Returns all vertices of the graph, reading every segment. """
+        self.__begin_query()
+        result = set()
+        for _, segment in self.__segments(range(self._shards)):
+            result.update(segment)
+        return result
+
+    def adjacents_to(self, vertex):
+        """ Same as Graph.adjacents_to. """
+        if self._digraph:
+            raise DigraphError("Digraph doesn't implement adjacents_to method.")
+        self.__begin_query()
+        return self.__neighbours(vertex) or set()
+
+    def sucessors(self, vertex):
+        """ Same as Graph.sucessors. """
+        if not self._digraph:
+            raise NotDigraphError("Not directed graphs doesn't implement sucessors method.")
+        self.__begin_query()
+        return self.__neighbours(vertex) or set()
+
+    def predecessors(self, vertex):
+        """ Same as Graph.predecessors. Reads every segment. """
+        if not self._digraph:
+            raise NotDigraphError("Not directed graphs doesn't implement predecessors method.")
+        self.__begin_query()
+        if self.__neighbours(vertex) is None:
+            return set()
+        result = set()
+        for _, segment in self.__segments(range(self._shards)):
+            result.update(v for v in segment if vertex in segment[v])
+        return result
+
+    def degree(self, vertex):
+        """ Same as Graph.degree. """
+        return len(self.adjacents_to(vertex))
+
+    def out_degree(self, vertex):
+        """ Same as Graph.out_degree. """
+        try:
+            return len(self.sucessors(vertex))
+        except NotDigraphError:
+            raise NotDigraphError("Not directed graphs doesn't implement out_degree method.")
+
+    def in_degree(self, vertex):
+        """ Same as Graph.in_degree. Reads every segment. """
+        try:
+            return len(self.predecessors(vertex))
+        except NotDigraphError:
+            raise NotDigraphError("Not directed graphs doesn't implement in_degree method.")
+
+    def bfs(self, vertex):
+        """ Breadth-first search starting at *vertex* (following sucessors in a digraph).
+
+        :param vertex: The vertex where the search starts.
+        :return A list of vertices in the order they were visited.
+        """
+        self.__begin_query()
+        if self.__neighbours(vertex) is None:
+            return []
+        visited = set([vertex])
+        order = []
+        frontier = [vertex]
+        while frontier:
+            order.extend(frontier)
+            by_shard = collections.defaultdict(list)
+            for v in frontier:
+                by_shard[shard_of(v, self._shards)].append(v)
+            following = []
+            for shard, segment in self.__segments(by_shard):
+                for v in by_shard[shard]:
+                    for u in segment.get(v, ()):
+                        if u not in visited:
+                            visited.add(u)
+                            following.append(u)
+            frontier = following
+        return order
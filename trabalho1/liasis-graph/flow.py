@@ -0,0 +1,275 @@
+#!/usr/bin/env python
+"""
+Maximum bipartite matching and maximum flow / minimum cut.
+
+hopcroft_karp finds a maximum matching between a set of "left" vertices and
+their neighbours (workers -> jobs) in O(E * sqrt(V)).
+
+max_flow and min_cut use Dinic's algorithm in O(V^2 * E) (much less in
+practice). The capacities come from an edge attribute of the graph (see
+Graph.set_edge_attribute). The residual network is kept in flat arrays,
+arc by arc, next to the adjacency: arcs[offsets[v]:offsets[v + 1]] are the
+arcs leaving v, with their head in heads[], their residual capacity in
+capacities[] and the index of the opposite arc in partners[].
+
+Both algorithms are iterative, so they work on graphs with long paths
+without hitting the recursion limit.
+
+=========================================
+
+Functions:
+
+    dict hopcroft_karp(graph, left)
+    (value, dict) max_flow(graph, source, sink, capacity, default)
+    (value, set) min_cut(graph, source, sink, capacity, default)
+
+=========================================
+
+@license: MIT License
+"""
+
+import collections
+from array import array
+
+INFINITY = float("inf")
+
+def _neighbours(graph):
+    if graph._digraph:
+        return graph.sucessors
+    return graph.adjacents_to
+
+########################
+##  Hopcroft - Karp  ##
+########################
+
+def hopcroft_karp(graph, left):
+    """ Return a maximum matching between *left* and their neighbours.
+
+    Edges between two left vertices are ignored.
+
+    :param graph: A graph or digraph (arcs are followed from the left vertices).
+    :param left: An iterable with the vertices of the left side.
+    :return A dictionary left vertex -> matched right vertex (unmatched vertices are absent).
+    """
+    neighbours = _neighbours(graph)
+    left = [u for u in dict.fromkeys(left) if u in graph._vertices]
+    is_left = set(left)
+    right = {}
+    adjacency = []
+    for u in left:
+        adjacency.append([right.setdefault(v, len(right)) for v in neighbours(u) if v not in is_left])
+    right_vertices = list(right)
+
+    n = len(left)
+    pair_left = [-1] * n
+    pair_right = [-1] * len(right)
+    distance = [0] * n
+    position = [0] * n
+    via = [0] * n
+
+    def layers():
+        queue = collections.deque()
+        for u in range(n):
+            if pair_left[u] == -1:
+                distance[u] = 0
+                queue.append(u)
+            else:
+                distance[u] = INFINITY
+        found = False
+        while queue:
+            u = queue.popleft()
+            for v in adjacency[u]:
+                w = pair_right[v]
+                if w == -1:
+                    found = True
+                elif distance[w] == INFINITY:
+                    distance[w] = distance[u] + 1
+                    queue.append(w)
+        return found
+
+    def augment(root):
+        stack = [root]
+        while stack:
+            u = stack[-1]
+            if position[u] < len(adjacency[u]):
+                v = adjacency[u][position[u]]
+                position[u] += 1
+                w = pair_right[v]
+                if w == -1:
+                    via[u] = v
+                    for x in stack:
+                        pair_left[x] = via[x]
+                        pair_right[via[x]] = x
+                    return True
+                if distance[w] == distance[u] + 1:
+                    via[u] = v
+                    stack.append(w)
+            else:
+                distance[u] = INFINITY
+                stack.pop()
+        return False
+
+    while layers():
+        for u in range(n):
+            position[u] = 0
+        for u in range(n):
+            if pair_left[u] == -1:
+                augment(u)
+
+    return dict((left[u], right_vertices[pair_left[u]]) for u in range(n) if pair_left[u] != -1)
+
+################
+##  Max Flow  ##
+################
+
+class FlowNetwork(object):
+    """ Residual network of a graph, stored in flat arrays (see the module documentation). """
+
+    def __init__(self, graph, capacity="capacity", default=1):
+        """ Build the residual network of *graph*.
+
+        :param graph: A digraph (or a not directed graph, whose edges carry flow both ways).
+        :param capacity: Name of the edge attribute holding the capacities.
+        :param default: Capacity of the edges without the attribute.
+        :return None
+        """
+        self.vertices = list(graph._vertices)
+        self.index = dict((v, i) for i, v in enumerate(self.vertices))
+        n = len(self.vertices)
+        column = graph.edge_attributes(capacity)
+        neighbours = _neighbours(graph)
+
+        arcs = []
+        counts = [0] * (n + 1)
+        for v in self.vertices:
+            i = self.index[v]
+            capacities = column.get(v, {})
+            for u in neighbours(v):
+                j = self.index[u]
+                arcs.append((i, j, capacities.get(u, default)))
+                counts[i + 1] += 1
+                counts[j + 1] += 1
+        for i in range(n):
+            counts[i + 1] += counts[i]
+
+        size = counts[n]
+        self.offsets = array("l", counts)
+        self.heads = array("l", bytes(size * array("l").itemsize))
+        self.partners = array("l", bytes(size * array("l").itemsize))
+        self.capacities = array("d", bytes(size * array("d").itemsize))
+        self.original = array("d", bytes(size * array("d").itemsize))
+        free = counts[:n]
+        for i, j, c in arcs:
+            forward, backward = free[i], free[j]
+            free[i] += 1
+            free[j] += 1
+            self.heads[forward], self.heads[backward] = j, i
+            self.partners[forward], self.partners[backward] = backward, forward
+            self.capacities[forward] = self.original[forward] = c
+
+    def __levels(self, source, sink):
+        offsets, heads, capacities = self.offsets, self.heads, self.capacities
+        level = [-1] * len(self.vertices)
+        level[source] = 0
+        queue = collections.deque([source])
+        while queue:
+            v = queue.popleft()
+            for e in range(offsets[v], offsets[v + 1]):
+                u = heads[e]
+                if level[u] < 0 and capacities[e] > 0:
+                    level[u] = level[v] + 1
+                    queue.append(u)
+        return level if level[sink] >= 0 else None
+
+    def run(self, source, sink):
+        """ Push a maximum flow from *source* to *sink* (indexes) and return its value. """
+        offsets, heads, capacities, partners = self.offsets, self.heads, self.capacities, self.partners
+        value = 0
+        if source == sink:
+            return value
+        while True:
+            level = self.__levels(source, sink)
+            if level is None:
+                return value
+            position = list(offsets[:-1])
+            path = []
+            v = source
+            while True:
+                if v == sink:
+                    pushed = min(capacities[e] for e in path)
+                    for e in path:
+                        capacities[e] -= pushed
+                        capacities[partners[e]] += pushed
+                    value += pushed
+                    path = []
+                    v = source
+                    continue
+                end = offsets[v + 1]
+                e = position[v]
+                while e < end and (capacities[e] <= 0 or level[heads[e]] != level[v] + 1):
+                    e += 1
+                position[v] = e
+                if e < end:
+                    path.append(e)
+                    v = heads[e]
+                    continue
+                # Dead end: no blocking path goes through v any more.
+                level[v] = -1
+                if not path:
+                    break
+                e = path.pop()
+                position[heads[partners[e]]] += 1
+                v = heads[partners[e]]
+
+    def flows(self):
+        """ Return the flow on each arc as a dictionary vertexA -> {vertexB: flow} (positive flows only). """
+        result = {}
+        for i, v in enumerate(self.vertices):
+            for e in range(self.offsets[i], self.offsets[i + 1]):
+                flow = self.original[e] - self.capacities[e]
+                if self.original[e] > 0 and flow > 0:
+                    result.setdefault(v, {})[self.vertices[self.heads[e]]] = flow
+        return result
+
+    def reachable(self, source):
+        """ Return the vertices reachable from *source* (an index) in the residual network. """
+        offsets, heads, capacities = self.offsets, self.heads, self.capacities
+        seen = set([source])
+        queue = collections.deque([source])
+        while queue:
+            v = queue.popleft()
+            for e in range(offsets[v], offsets[v + 1]):
+                u = heads[e]
+                if u not in seen and capacities[e] > 0:
+                    seen.add(u)
+                    queue.append(u)
+        return set(self.vertices[i] for i in seen)
+
+def max_flow(graph, source, sink, capacity="capacity", default=1):
+    """ Return a maximum flow from *source* to *sink*.
+
+    :param graph: A digraph (or a not directed graph).
+    :param source: The source vertex.
+    :param sink: The sink vertex.
+    :param capacity: Name of the edge attribute holding the capacities.
+    :param default: Capacity of the edges without the attribute.
+    :return A pair (value, flows), where flows is a dictionary vertexA -> {vertexB: flow}.
+    """
+    network = FlowNetwork(graph, capacity, default)
+    value = network.run(network.index[source], network.index[sink])
+    return value, network.flows()
+
+def min_cut(graph, source, sink, capacity="capacity", default=1):
+    """ Return a minimum cut between *source* and *sink*.
+
+    :param graph: A digraph (or a not directed graph).
+    :param source: The source vertex.
+    :param sink: The sink vertex.
+    :param capacity: Name of the edge attribute holding the capacities.
+    :param default: Capacity of the edges without the attribute.
+    :return A pair (value, side), where side is the set of vertices on the source side of the cut.
+    """
+    network = FlowNetwork(graph, capacity, default)
+    s = network.index[source]
+    value = network.run(s, network.index[sink])
+    return value, network.reachable(s)
@@ -0,0 +1,218 @@
+#!/usr/bin/env python
+"""
+Graph generators for tests and benchmarks.
+
+Every generator fills the dictionary of sets directly and hands it to Graph at
+the end, instead of calling add and connect for each vertex and edge (which
+would also write every change to the change log). Vertices are the integers
+0..n-1. The random generators take a *seed* and always build the same graph
+for the same seed.
+
+    graph = erdos_renyi(100000, 0.0001, seed=42)
+    graph = barabasi_albert(100000, 3, seed=42)
+
+=========================================
+
+Generators:
+
+    Graph complete_graph(n, digraph)
+    Graph grid_graph(rows, columns)
+    Graph erdos_renyi(n, p, seed, digraph)
+    Graph barabasi_albert(n, m, seed)
+    Graph watts_strogatz(n, k, p, seed)
+    Graph rmat(scale, edge_factor, a, b, c, seed, digraph)
+
+=========================================
+
+@license: MIT License
+"""
+
+import math
+import random
+from graph import Graph
+
+def _empty(n):
+    return dict((v, set()) for v in range(n))
+
+def complete_graph(n, digraph=False):
+    """ Graph where every vertex is connected to every other one.
+
+    :param n: Number of vertices.
+    :param digraph: True to build a complete digraph (an arc in each direction).
+    :return A Graph.
+    """
+    everything = frozenset(range(n))
+    return Graph(dict((v, set(everything - set([v]))) for v in range(n)), digraph)
+
+def grid_graph(rows, columns):
+    """ Two dimensional grid, vertex r * columns + c being connected to its 4 neighbours.
+
+    :param rows: Number of rows.
+    :param columns: Number of columns.
+    :return A Graph.
+    """
+    vertices = _empty(rows * columns)
+    for r in range(rows):
+        for c in range(columns):
+            v = r * columns + c
+            if c + 1 < columns:
+                vertices[v].add(v + 1)
+                vertices[v + 1].add(v)
+            if r + 1 < rows:
+                vertices[v].add(v + columns)
+                vertices[v + columns].add(v)
+    return Graph(vertices)
+
+def _skips(p, rnd):
+    """ Yield the gaps between consecutive selected items when each one is selected with probability p. """
+    log_q = math.log(1.0 - p)
+    random_value = rnd.random
+    while True:
+        yield int(math.log(1.0 - random_value()) / log_q)
+
+def erdos_renyi(n, p, seed=None, digraph=False):
+    """ G(n, p) random graph: each possible edge exists with probability p.
+
+    Instead of drawing a random number for each of the n^2 / 2 possible edges,
+    draws the geometrically distributed gap to the next existing edge (Batagelj
+    and Brandes), so the cost is proportional to the number of edges.
+
+    :param n: Number of vertices.
+    :param p: Probability of each edge.
+    :param seed: Seed of the random number generator.
+    :param digraph: True to build a digraph (each ordered pair is drawn independently).
+    :return A Graph.
+    """
+    if p >= 1:
+        return complete_graph(n, digraph)
+    vertices = _empty(n)
+    if p <= 0 or n < 2:
+        return Graph(vertices, digraph)
+    skips = _skips(p, random.Random(seed))
+
+    if digraph:
+        # Arcs are numbered 0 .. n * (n - 1) - 1, skipping the self loops.
+        total = n * (n - 1)
+        k = -1
+        while True:
+            k += 1 + next(skips)
+            if k >= total:
+                break
+            v, w = divmod(k, n - 1)
+            vertices[v].add(w if w < v else w + 1)
+        return Graph(vertices, digraph)
+
+    v, w = 1, -1
+    while v < n:
+        w += 1 + next(skips)
+        while w >= v and v < n:
+            w -= v
+            v += 1
+        if v < n:
+            vertices[v].add(w)
+            vertices[w].add(v)
+    return Graph(vertices)
+
+def barabasi_albert(n, m, seed=None):
+    """ Preferential attachment graph (Barabasi and Albert).
+
+    Starts with m vertices; every new vertex is connected to m distinct existing
+    vertices chosen with probability proportional to their degree, which gives
+    a power law degree distribution.
+
+    :param n: Number of vertices.
+    :param m: Number of edges of each new vertex (1 <= m < n).
+    :param seed: Seed of the random number generator.
+    :return A Graph.
+    """
+    if m < 1 or m >= n:
+        raise ValueError("barabasi_albert needs 1 <= m < n.")
+    rnd = random.Random(seed)
+    vertices = _empty(n)
+    # Each vertex appears in *repeated* once per edge, so a uniform choice from it
+    # is a choice proportional to the degree.
+    repeated = []
+    targets = list(range(m))
+    for source in range(m, n):
+        neighbours = vertices[source]
+        for t in targets:
+            neighbours.add(t)
+            vertices[t].add(source)
+        repeated.extend(targets)
+        repeated.extend([source] * m)
+        chosen = set()
+        while len(chosen) < m:
+            chosen.add(rnd.choice(repeated))
+        targets = list(chosen)
+    return Graph(vertices)
+
+def watts_strogatz(n, k, p, seed=None):
+    """ Small-world graph (Watts and Strogatz).
+
+    Starts from a ring where each vertex is connected to its k nearest
+    neighbours (k / 2 on each side), then rewires the far end of each edge to a
+    random vertex with probability p, avoiding self loops and repeated edges.
+
+    :param n: Number of vertices.
+    :param k: Even number of neighbours of each vertex in the ring (k < n).
+    :param p: Rewiring probability.
+    :param seed: Seed of the random number generator.
+    :return A Graph.
+    """
+    if k >= n or k % 2:
+        raise ValueError("watts_strogatz needs an even k < n.")
+    rnd = random.Random(seed)
+    vertices = _empty(n)
+    for v in range(n):
+        for j in range(1, k // 2 + 1):
+            u = (v + j) % n
+            vertices[v].add(u)
+            vertices[u].add(v)
+    for j in range(1, k // 2 + 1):
+        for v in range(n):
+            if rnd.random() < p:
+                u = (v + j) % n
+                w = rnd.randrange(n)
+                if w == v or w in vertices[v] or len(vertices[v]) >= n - 1:
+                    continue
+                vertices[v].discard(u)
+                vertices[u].discard(v)
+                vertices[v].add(w)
+                vertices[w].add(v)
+    return Graph(vertices)
+
+def rmat(scale, edge_factor=16, a=0.57, b=0.19, c=0.19, seed=None, digraph=False):
+    """ R-MAT (recursive matrix / Kronecker) graph, as used by Graph500.
+
+    Each edge picks one quadrant of the adjacency matrix with probabilities
+    a, b, c and 1 - a - b - c, then recurses into it *scale* times. Edges are
+    drawn one level at a time for all edges at once. Self loops and repeated
+    edges are dropped, so the graph has a bit less than edge_factor * 2^scale
+    edges and a skewed degree distribution.
+
+    :param scale: The graph has 2^scale vertices.
+    :param edge_factor: Number of edges drawn per vertex.
+    :param a: Probability of the top left quadrant.
+    :param b: Probability of the top right quadrant.
+    :param c: Probability of the bottom left quadrant.
+    :param seed: Seed of the random number generator.
+    :param digraph: True to build a digraph.
+    :return A Graph.
+    """
+    n = 1 << scale
+    m = edge_factor * n
+    rnd = random.Random(seed)
+    weights = [a, b, c, 1.0 - a - b - c]
+    sources = [0] * m
+    destinations = [0] * m
+    for _ in range(scale):
+        quadrants = rnd.choices(range(4), weights, k=m)
+        sources = [(s << 1) | (q >> 1) for s, q in zip(sources, quadrants)]
+        destinations = [(d << 1) | (q & 1) for d, q in zip(destinations, quadrants)]
+    vertices = _empty(n)
+    for s, d in zip(sources, destinations):
+        if s != d:
+            vertices[s].add(d)
+            if not digraph:
+                vertices[d].add(s)
+    return Graph(vertices, digraph)
@@ -5,7 +5,8 @@ A Graph / Digraph implementation in Python.
 Each vertice is implemented as a Python dictionary, a data structure that 
 associates a given "key" with a "value". In our case a "key" is a string
 representing the label of the vertex and the value is a set of "vertex" 
-that is connected to the first one.
+that is connected to the first one. Any hashable object (numbers, tuples...)
+can be used as a vertex as well.
 
 For example, if we have a graph with two vertices connected (called "A" and 
 "B", respectively), we would represent it in the following way:
@@ -29,6 +30,34 @@ Basic methods:
     int degree(vertex)
     int in_degree(vertex)
     int out_degree(vertex)
+
+Change log:
+
+    int version()
+    list changes_since(version)
+    batch()
+
+Attributes (one dictionary per attribute, not one per vertex):
+
+    void set_vertex_attribute(vertex, name, value)
+    value vertex_attribute(vertex, name, default)
+    void set_vertex_attributes(name, values)
+    dict vertex_attributes(name)
+    void set_edge_attribute(vertexA, vertexB, name, value)
+    value edge_attribute(vertexA, vertexB, name, default)
+    void set_edge_attributes(name, values)
+    dict edge_attributes(name)
+    Vertex vertex(vertex)
+    Edge edge(vertexA, vertexB)
+    generator(Edge) edges()
+
+Comparison:
+
+    int fingerprint()
+    bool graph == other
+
+ReadOnlyGraph is a Graph whose mutations raise ReadOnlyGraphError. It's the
+base class of snapshots (concurrent_graph) and subgraph views (subgraph).
        
 Complex methods:      
        
@@ -46,20 +75,47 @@ Complex methods:
 @license: MIT License
 """
 
+import bisect
+import contextlib
 import random
-from graph_exceptions import NotDigraphError, DigraphError
+from graph_exceptions import NotDigraphError, DigraphError, ReadOnlyGraphError
+
+FINGERPRINT_MASK = (1 << 64) - 1
+
+def _vertex_hash(vertex):
+    return hash((vertex,))
+
+def _arc_hash(vertexA, vertexB):
+    return hash((vertexA, vertexB))
+
+def _fingerprint(vertices):
+    """ Sum (mod 2^64) of the hashes of every vertex and every stored adjacency entry. """
+    total = 0
+    for v in vertices:
+        total += _vertex_hash(v)
+        for u in vertices[v]:
+            total += _arc_hash(v, u)
+    return total & FINGERPRINT_MASK
 
 class Graph(object):
 
-    def __init__(self, vertices={}, digraph=False):
+    def __init__(self, vertices=None, digraph=False):
         """ Creates a new graph.
 
-        :param vertices: A dictionary of vertices to be setted as vertices for the new graph.
+        :param vertices: A dictionary of vertices to be setted as vertices for the new graph
+                         (used as is, not copied). Defaults to a new empty dictionary.
         :param digraph: True if the graph is a directed graph. Defaults to false.
         :return None
         """
-        self._vertices = vertices
+        self._vertices = vertices if vertices is not None else {}
         self._digraph = digraph
+        self._version = 0
+        self._log = []
+        self._log_versions = []
+        self._pending = None
+        self._vertex_attributes = {}
+        self._edge_attributes = {}
+        self._fingerprint = None
     
     ########################
     ##  Basic Operations  ##
@@ -68,11 +124,12 @@ class Graph(object):
     def add(self, vertex):
         """ Add a vertice to the graph.
 
+        Inside a batch (see batch), the operation is only applied when the batch ends.
+
         :param vertex: The vertex (in other words, only a string) to be added to the graph.
         :return None
         """
-        if vertex not in self._vertices:
-            self._vertices[vertex] = set()
+        self.__mutate("add", vertex)
 
     def remove(self, vertex):
         """ Remove a vertice from the graph. 
@@ -80,14 +137,12 @@ class Graph(object):
         If the graph isn't a directed graph (digraph), remove all connections between 
         *vertex* and other vertices of the graph. Otherwise
 
+        Inside a batch (see batch), the operation is only applied when the batch ends.
+
         :param vertex: The vertex to be removed.
         :return None
         """
-        if vertex in self._vertices:
-            for v in self._vertices:
-                if vertex in self._vertices[v]:
-                    self._vertices[v].remove(vertex)
-            del self._vertices[vertex]
+        self.__mutate("remove", vertex)
 
     def connect(self, vertexA, vertexB):
         """ Connect vertexA to vertexB.
@@ -96,14 +151,13 @@ class Graph(object):
         vertex (in other words, the edge from A to B will be created). If it isn't a 
         digraph, create an edge from vertexA to vertexB AND from vertexB to vertexA. 
 
+        Inside a batch (see batch), the operation is only applied when the batch ends.
+
         :param vertexA: The origin vertex.
         :param vertexB: The destiny vertex.
         :return None
         """
-        if (vertexA in self._vertices) and (vertexB in self._vertices):
-            self._vertices[vertexA].add(vertexB)
-            if not self._digraph:
-                self._vertices[vertexB].add(vertexA)
+        self.__mutate("connect", vertexA, vertexB)
 
     def disconnect(self, vertexA, vertexB):
         """ Disconnect vertexA to vertexB.
@@ -112,15 +166,13 @@ class Graph(object):
         vertex (in other words, the edge from A to B will be removed). If it isn't a 
         digraph, remove the edge from vertexA to vertexB AND from vertexB to vertexA. 
 
+        Inside a batch (see batch), the operation is only applied when the batch ends.
+
         :param vertexA: The origin vertex.
         :param vertexB: The destiny vertex.
         :return None
         """
-        if (vertexA in self._vertices) and (vertexB in self._vertices):
-            if vertexB in self._vertices[vertexA]:
-                self._vertices[vertexA].remove(vertexB)
-                if not self._digraph:
-                    self._vertices[vertexB].remove(vertexA)
+        self.__mutate("disconnect", vertexA, vertexB)
 
     def vertices(self):
         """ Returns all vertices of the graph. 
@@ -242,6 +294,378 @@ class Graph(object):
             raise DigraphError("Digraph doesn't implement Degree method. \
                 Take a look at in_degree(vertex) and out_degree(vertex).")
 
+    ##################
+    ##  Change Log  ##
+    ##################
+
+    def version(self):
+        """ Return the current version of the graph.
+
+        The version starts at 0 and is incremented every time a mutation (or a whole
+        batch of mutations) actually changes the graph. Mutations that don't change
+        anything (adding a vertex twice, connecting unknown vertices...) don't bump it.
+
+        :return A integer representing the version.
+        """
+        return self._version
+
+    def changes_since(self, version):
+        """ Return every change applied after *version*.
+
+        Each change is a tuple (version, operation, arguments), where operation is one of
+        "add", "remove", "connect" or "disconnect" and arguments is the tuple of vertices
+        given to that operation. Removing a vertex also logs, under the same version and
+        just before the "remove", a "disconnect" for every edge removed with it (for a
+        not directed graph, with the removed vertex first), so derived indexes (degrees,
+        edge lists...) learn about those edges too. Changes are returned in the order they
+        were applied, and the cost is proportional to the number of changes returned
+        (plus a binary search).
+
+        :param version: The last version already seen by the caller.
+        :return A list of changes.
+        """
+        first = bisect.bisect_right(self._log_versions, version)
+        return self._log[first:]
+
+    @contextlib.contextmanager
+    def batch(self):
+        """ Group mutations and apply them together.
+
+        Inside the *with* block, add/remove/connect/disconnect are queued instead of being
+        applied. When the block ends, all of them are applied at once and share a single
+        new version number. If the block raises an exception, the queued mutations are
+        discarded. If a queued mutation is invalid (an unhashable vertex), none of them is
+        applied and the error is raised when the block ends. Attributes set inside the
+        block are queued too, in order with the mutations, so they can be set on the
+        vertices and edges the batch creates. Nested batches are merged into the
+        outermost one.
+
+            with graph.batch():
+                graph.add("a")
+                graph.connect("a", "b")
+
+        :return None
+        """
+        if self._pending is not None:
+            yield
+            return
+
+        self._pending = []
+        try:
+            yield
+            pending = self._pending
+        finally:
+            self._pending = None
+        self.__apply(pending)
+
+    def __mutate(self, operation, *arguments):
+        if self._pending is not None:
+            self._pending.append((operation, arguments))
+        else:
+            self.__apply([(operation, arguments)])
+
+    def __apply(self, mutations):
+        operations = {
+            "add": self.__add,
+            "remove": self.__remove,
+            "connect": self.__connect,
+            "disconnect": self.__disconnect,
+        }
+        attributes = {
+            "set_vertex_attribute": self.__set_vertex_attribute,
+            "set_vertex_attributes": self.__set_vertex_attributes,
+            "set_edge_attribute": self.__set_edge_attribute,
+        }
+        # Vertices must be hashable: check every queued mutation before applying any of
+        # them, so an invalid one leaves the graph (and its version) untouched. (The
+        # vertices of queued attributes were checked when they were queued.)
+        for operation, arguments in mutations:
+            if operation in operations:
+                for vertex in arguments:
+                    hash(vertex)
+        version = self._version + 1
+        changed = False
+        try:
+            for operation, arguments in mutations:
+                if operation in attributes:
+                    attributes[operation](*arguments)
+                    continue
+                for change in operations[operation](*arguments):
+                    self._log.append((version,) + change)
+                    self._log_versions.append(version)
+                    changed = True
+        finally:
+            # Should a mutation still fail, the ones already applied keep their own
+            # version: a version number is never shared by two different change sets.
+            if changed:
+                self._version = version
+
+    def __add(self, vertex):
+        if vertex not in self._vertices:
+            self._vertices[vertex] = set()
+            self.__rehash(_vertex_hash(vertex))
+            return [("add", (vertex,))]
+        return []
+
+    def __remove(self, vertex):
+        if vertex in self._vertices:
+            # The edges removed with the vertex are logged before it, as disconnects.
+            changes = []
+            for v in self._vertices:
+                if vertex in self._vertices[v]:
+                    self._vertices[v].remove(vertex)
+                    self.__rehash(-_arc_hash(v, vertex))
+                    changes.append(("disconnect", (v, vertex) if self._digraph else (vertex, v)))
+                    for column in self._edge_attributes.values():
+                        if v in column:
+                            column[v].pop(vertex, None)
+            if self._digraph:
+                changes.extend(("disconnect", (vertex, u)) for u in self._vertices[vertex])
+            changes.append(("remove", (vertex,)))
+            if self._fingerprint is not None:
+                self.__rehash(-_vertex_hash(vertex) - sum(_arc_hash(vertex, u) for u in self._vertices[vertex]))
+            del self._vertices[vertex]
+            for column in self._vertex_attributes.values():
+                column.pop(vertex, None)
+            for column in self._edge_attributes.values():
+                column.pop(vertex, None)
+            return changes
+        return []
+
+    def __connect(self, vertexA, vertexB):
+        if (vertexA in self._vertices) and (vertexB in self._vertices):
+            changed = False
+            if vertexB not in self._vertices[vertexA]:
+                self._vertices[vertexA].add(vertexB)
+                self.__rehash(_arc_hash(vertexA, vertexB))
+                changed = True
+            if not self._digraph and vertexA not in self._vertices[vertexB]:
+                self._vertices[vertexB].add(vertexA)
+                self.__rehash(_arc_hash(vertexB, vertexA))
+                changed = True
+            if changed:
+                return [("connect", (vertexA, vertexB))]
+        return []
+
+    def __disconnect(self, vertexA, vertexB):
+        if (vertexA in self._vertices) and (vertexB in self._vertices):
+            if vertexB in self._vertices[vertexA]:
+                self._vertices[vertexA].remove(vertexB)
+                self.__rehash(-_arc_hash(vertexA, vertexB))
+                if not self._digraph and vertexA in self._vertices[vertexB]:
+                    self._vertices[vertexB].remove(vertexA)
+                    self.__rehash(-_arc_hash(vertexB, vertexA))
+                for column in self._edge_attributes.values():
+                    self.__forget(column, vertexA, vertexB)
+                return [("disconnect", (vertexA, vertexB))]
+        return []
+
+    def __rehash(self, delta):
+        if self._fingerprint is not None:
+            self._fingerprint = (self._fingerprint + delta) & FINGERPRINT_MASK
+
+    ##################
+    ##  Attributes  ##
+    ##################
+
+    def vertex(self, vertex):
+        """ Return a Vertex record for *vertex*, or None if it isn't in the graph.
+
+        :param vertex: The vertex.
+        :return A Vertex.
+        """
+        if vertex in self._vertices:
+            return Vertex(self, vertex)
+        return None
+
+    def edge(self, vertexA, vertexB):
+        """ Return an Edge record for the edge from vertexA to vertexB, or None if there's no such edge.
+
+        :param vertexA: The origin vertex.
+        :param vertexB: The destiny vertex.
+        :return An Edge.
+        """
+        if vertexA in self._vertices and vertexB in self._vertices[vertexA]:
+            return Edge(self, vertexA, vertexB)
+        return None
+
+    def edges(self):
+        """ Yield an Edge record for every edge of the graph.
+
+        For a not directed graph each edge is yielded only once.
+
+        :return A generator of Edge.
+        """
+        done = set()
+        for v in self._vertices:
+            for u in self._vertices[v]:
+                if self._digraph or u not in done:
+                    yield Edge(self, v, u)
+            if not self._digraph:
+                done.add(v)
+
+    def set_vertex_attribute(self, vertex, name, value):
+        """ Set the attribute *name* of *vertex*. Ignored if *vertex* isn't in the graph.
+
+        Attributes aren't mutations: they don't bump the version and aren't written to
+        the change log. Inside a batch they are queued with the mutations (see batch).
+
+        :param vertex: The vertex.
+        :param name: The name of the attribute.
+        :param value: The value.
+        :return None
+        """
+        if self._pending is not None:
+            hash(vertex)
+            self._pending.append(("set_vertex_attribute", (vertex, name, value)))
+        else:
+            self.__set_vertex_attribute(vertex, name, value)
+
+    def __set_vertex_attribute(self, vertex, name, value):
+        if vertex in self._vertices:
+            self._vertex_attributes.setdefault(name, {})[vertex] = value
+
+    def vertex_attribute(self, vertex, name, default=None):
+        """ Return the attribute *name* of *vertex*, or *default* if it isn't set. """
+        column = self._vertex_attributes.get(name)
+        if column is None:
+            return default
+        return column.get(vertex, default)
+
+    def set_vertex_attributes(self, name, values):
+        """ Set the attribute *name* of many vertices at once.
+
+        :param name: The name of the attribute.
+        :param values: A dictionary vertex -> value. Vertices not in the graph are ignored.
+        :return None
+        """
+        if self._pending is not None:
+            self._pending.append(("set_vertex_attributes", (name, dict(values))))
+        else:
+            self.__set_vertex_attributes(name, values)
+
+    def __set_vertex_attributes(self, name, values):
+        column = self._vertex_attributes.setdefault(name, {})
+        vertices = self._vertices
+        column.update((v, values[v]) for v in values if v in vertices)
+
+    def vertex_attributes(self, name):
+        """ Return the whole column of the attribute *name*.
+
+        The column is the dictionary vertex -> value used by the graph itself, so
+        reading it has no cost; don't change it directly.
+
+        :param name: The name of the attribute.
+        :return A dictionary vertex -> value (empty if the attribute was never set).
+        """
+        return self._vertex_attributes.get(name, {})
+
+    def set_edge_attribute(self, vertexA, vertexB, name, value):
+        """ Set the attribute *name* of the edge from vertexA to vertexB. Ignored if there's no such edge.
+
+        For a not directed graph the attribute is shared by both directions.
+
+        :param vertexA: The origin vertex.
+        :param vertexB: The destiny vertex.
+        :param name: The name of the attribute.
+        :param value: The value.
+        :return None
+        """
+        if self._pending is not None:
+            hash(vertexA)
+            hash(vertexB)
+            self._pending.append(("set_edge_attribute", (vertexA, vertexB, name, value)))
+        else:
+            self.__set_edge_attribute(vertexA, vertexB, name, value)
+
+    def __set_edge_attribute(self, vertexA, vertexB, name, value):
+        if vertexA in self._vertices and vertexB in self._vertices[vertexA]:
+            column = self._edge_attributes.setdefault(name, {})
+            column.setdefault(vertexA, {})[vertexB] = value
+            if not self._digraph:
+                column.setdefault(vertexB, {})[vertexA] = value
+
+    def edge_attribute(self, vertexA, vertexB, name, default=None):
+        """ Return the attribute *name* of the edge from vertexA to vertexB, or *default*. """
+        column = self._edge_attributes.get(name)
+        if column is None or vertexA not in column:
+            return default
+        return column[vertexA].get(vertexB, default)
+
+    def set_edge_attributes(self, name, values):
+        """ Set the attribute *name* of many edges at once.
+
+        :param name: The name of the attribute.
+        :param values: A dictionary (vertexA, vertexB) -> value. Missing edges are ignored.
+        :return None
+        """
+        for (vertexA, vertexB), value in values.items():
+            self.set_edge_attribute(vertexA, vertexB, name, value)
+
+    def edge_attributes(self, name):
+        """ Return the whole column of the edge attribute *name*.
+
+        The column is the dictionary vertexA -> {vertexB: value} used by the graph
+        itself (both directions are present for a not directed graph), so reading
+        it has no cost; don't change it directly.
+
+        :param name: The name of the attribute.
+        :return A dictionary of dictionaries (empty if the attribute was never set).
+        """
+        return self._edge_attributes.get(name, {})
+
+    def __forget(self, column, vertexA, vertexB):
+        if vertexA in column:
+            column[vertexA].pop(vertexB, None)
+        if not self._digraph and vertexB in column:
+            column[vertexB].pop(vertexA, None)
+
+    ##################
+    ##  Comparison  ##
+    ##################
+
+    def fingerprint(self):
+        """ Return an order-independent hash of the vertices and edges of the graph.
+
+        The fingerprint is the sum (mod 2^64) of a hash per vertex and per adjacency
+        entry. The first call computes it in O(V + E); after that every mutation keeps
+        it up to date in O(1), so checking whether a graph changed (or may be equal to
+        another one) is a single integer comparison. Equal graphs always have the same
+        fingerprint; different graphs almost never do. Like hash(), it depends on the
+        hash seed of the process (PYTHONHASHSEED) for strings and other objects.
+
+        :return A integer between 0 and 2^64 - 1.
+        """
+        if self._fingerprint is None:
+            self._fingerprint = _fingerprint(self._vertices)
+        return self._fingerprint
+
+    def __eq__(self, other):
+        """ Two graphs are equal when they have the same vertices and the same edges.
+
+        Attributes and versions are not compared. The kind of graph, the orders and the
+        fingerprints are checked first, so different graphs are usually told apart in O(1).
+        """
+        if not isinstance(other, Graph):
+            return NotImplemented
+        if self is other:
+            return True
+        if self._digraph != other._digraph or len(self._vertices) != len(other._vertices):
+            return False
+        if self.fingerprint() != other.fingerprint():
+            return False
+        for v in self._vertices:
+            if v not in other._vertices or set(self._vertices[v]) != set(other._vertices[v]):
+                return False
+        return True
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    # Graphs are mutable, so they can't be dictionary keys (use fingerprint() instead).
+    __hash__ = None
+
     ##########################
     ##  Derived Operations  ##
     ##########################
@@ -310,4 +734,95 @@ class Graph(object):
                     return True
 
         already_visited.remove(current_vertex)
-        return False
\ No newline at end of file
+        return False
+
+
+class ReadOnlyGraph(Graph):
+    """ A Graph that can only be read. Every mutation raises ReadOnlyGraphError. """
+
+    def add(self, vertex):
+        raise ReadOnlyGraphError("This graph can't be changed.")
+
+    def remove(self, vertex):
+        raise ReadOnlyGraphError("This graph can't be changed.")
+
+    def connect(self, vertexA, vertexB):
+        raise ReadOnlyGraphError("This graph can't be changed.")
+
+    def disconnect(self, vertexA, vertexB):
+        raise ReadOnlyGraphError("This graph can't be changed.")
+
+    def batch(self):
+        raise ReadOnlyGraphError("This graph can't be changed.")
+
+    def set_vertex_attribute(self, vertex, name, value):
+        raise ReadOnlyGraphError("This graph can't be changed.")
+
+    def set_vertex_attributes(self, name, values):
+        raise ReadOnlyGraphError("This graph can't be changed.")
+
+    def set_edge_attribute(self, vertexA, vertexB, name, value):
+        raise ReadOnlyGraphError("This graph can't be changed.")
+
+    def set_edge_attributes(self, name, values):
+        raise ReadOnlyGraphError("This graph can't be changed.")
+
+class Vertex(object):
+    """ A lightweight record for a vertex of a graph.
+
+    Records don't hold any data: record["name"] reads and writes the attribute
+    columns of the graph. Two records are equal (and have the same hash) when
+    they refer to the same vertex.
+    """
+
+    __slots__ = ("graph", "label")
+
+    def __init__(self, graph, label):
+        self.graph = graph
+        self.label = label
+
+    def __getitem__(self, name):
+        return self.graph.vertex_attribute(self.label, name)
+
+    def __setitem__(self, name, value):
+        self.graph.set_vertex_attribute(self.label, name, value)
+
+    def __eq__(self, other):
+        return isinstance(other, Vertex) and self.label == other.label
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.label)
+
+    def __repr__(self):
+        return "Vertex(%r)" % (self.label,)
+
+class Edge(object):
+    """ A lightweight record for an edge of a graph, see Vertex. """
+
+    __slots__ = ("graph", "source", "target")
+
+    def __init__(self, graph, source, target):
+        self.graph = graph
+        self.source = source
+        self.target = target
+
+    def __getitem__(self, name):
+        return self.graph.edge_attribute(self.source, self.target, name)
+
+    def __setitem__(self, name, value):
+        self.graph.set_edge_attribute(self.source, self.target, name, value)
+
+    def __eq__(self, other):
+        return isinstance(other, Edge) and (self.source, self.target) == (other.source, other.target)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((self.source, self.target))
+
+    def __repr__(self):
+        return "Edge(%r, %r)" % (self.source, self.target)
@@ -2,7 +2,7 @@
 """
 Implementation of graphs exceptions.
 
-These classes (DigraphError and NotDigraphError) will be useful to raise exceptions when the graph structure don't support a given operation. For example, this can happen when you try to call "degree" method for a non-directed graph. 
+These classes (DigraphError, NotDigraphError and ReadOnlyGraphError) will be useful to raise exceptions when the graph structure don't support a given operation. For example, this can happen when you try to call "degree" method for a non-directed graph, or when you try to change a graph that can only be read (such as a published snapshot). 
 
 Check out the documentation for each method implemented in 'graph.py', it will show you whether an exception is raised or not.
 """
@@ -18,4 +18,11 @@ class NotDigraphError(Exception):
 		self.value = value
 
 	def __str__(self):
-		return repr(self.value)
\ No newline at end of file
+		return repr(self.value)
+
+class ReadOnlyGraphError(Exception):
+	def __init__(self, value):
+		self.value = value
+
+	def __str__(self):
+		return repr(self.value)
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+"""
+Structural (Weisfeiler-Lehman) hash of a graph.
+
+Graph.fingerprint tells whether two graphs have the same labelled vertices
+and edges. weisfeiler_lehman ignores the labels and hashes only the shape of
+the graph: isomorphic graphs always get the same hash, so two graphs with
+different hashes can't be isomorphic. That makes it a cheap filter before an
+expensive isomorphism test, or a key to group graphs that may be duplicates.
+(Some non isomorphic graphs, such as regular graphs of the same degree and
+order, do share a hash.)
+
+Every vertex starts with the same label (or the value of a vertex attribute)
+and, on each iteration, gets a new label by hashing its own label with the
+sorted labels of its neighbours (of its sucessors and predecessors apart, for
+a digraph). The hash of the graph is the hash of the sorted labels of all
+iterations. Labels are blake2b digests, so, unlike fingerprints, the result
+is the same in every process and can be stored.
+
+    weisfeiler_lehman(graph) == weisfeiler_lehman(relabelled_copy)  # True
+
+=========================================
+
+Functions:
+
+    str weisfeiler_lehman(graph, iterations, attribute)
+    bool may_be_isomorphic(graphA, graphB, iterations)
+
+=========================================
+
+@license: MIT License
+"""
+
+import hashlib
+from csr import CSR
+
+def _digest(*parts):
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(part)
+        h.update(b"|")
+    return h.digest()
+
+def weisfeiler_lehman(graph, iterations=3, attribute=None):
+    """ Return the Weisfeiler-Lehman hash of *graph*.
+
+    :param graph: A graph or digraph (or a view / snapshot).
+    :param iterations: Number of refinement rounds (the radius of the neighbourhoods hashed).
+    :param attribute: Name of a vertex attribute used as initial label, or None.
+    :return A hexadecimal string.
+    """
+    matrix = CSR.from_graph(graph)
+    reverse = matrix.reverse() if matrix.digraph else None
+    if attribute is None:
+        labels = [_digest()] * matrix.order()
+    else:
+        column = graph.vertex_attributes(attribute)
+        labels = [_digest(repr(column.get(v)).encode("utf-8")) for v in matrix.vertices]
+
+    kind = b"digraph" if matrix.digraph else b"graph"
+    rounds = [b"".join(sorted(labels))]
+    for _ in range(iterations):
+        new = []
+        for i in range(matrix.order()):
+            sucessors = b"".join(sorted(labels[j] for j in matrix.neighbours(i)))
+            if reverse is None:
+                new.append(_digest(labels[i], sucessors))
+            else:
+                predecessors = b"".join(sorted(labels[j] for j in reverse.neighbours(i)))
+                new.append(_digest(labels[i], sucessors, predecessors))
+        labels = new
+        rounds.append(b"".join(sorted(labels)))
+    return _digest(kind, *rounds).hex()
+
+def may_be_isomorphic(graphA, graphB, iterations=3):
+    """ Return False when *graphA* and *graphB* are surely not isomorphic.
+
+    Compares the kinds, orders and number of edges first, then the
+    Weisfeiler-Lehman hashes. True means "maybe": only an isomorphism test can tell.
+
+    :return True or False.
+    """
+    if graphA._digraph != graphB._digraph or graphA.order() != graphB.order():
+        return False
+    if sum(len(graphA._vertices[v]) for v in graphA._vertices) != \
+            sum(len(graphB._vertices[v]) for v in graphB._vertices):
+        return False
+    return weisfeiler_lehman(graphA, iterations) == weisfeiler_lehman(graphB, iterations)
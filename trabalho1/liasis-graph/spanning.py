@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+"""
+Minimum spanning tree / forest of a weighted, not directed graph.
+
+Weights come from an edge attribute (see Graph.set_edge_attribute); edges
+without it weigh *default*. If the graph isn't connected, the result is a
+minimum spanning forest: one tree per connected component. Both functions
+return a new Graph with every vertex of the original one, the edges of the
+forest (with their weight copied to the same attribute) and the total weight.
+
+    forest, total = kruskal(graph)
+
+kruskal sorts all the edges once and joins components with a union-find
+(path halving, union by size), in O(E log E); it stops as soon as V - 1 edges
+were taken. prim grows each tree from a vertex with a binary heap, in
+O(E log V). In this implementation the single bulk sort of kruskal is faster
+on both sparse and dense graphs (see bench_spanning.py); prim is there for
+callers that want the trees grown one component at a time.
+
+=========================================
+
+Functions:
+
+    (Graph, total) kruskal(graph, weight, default)
+    (Graph, total) prim(graph, weight, default)
+    (Graph, total) minimum_spanning_tree(graph, weight, default, algorithm)
+
+=========================================
+
+@license: MIT License
+"""
+
+import heapq
+from array import array
+from csr import CSR
+from graph import Graph
+
+def _forest(matrix, edges, weights, name):
+    vertices = dict((v, set()) for v in matrix.vertices)
+    values = {}
+    total = 0
+    for (i, j), w in zip(edges, weights):
+        a, b = matrix.vertices[i], matrix.vertices[j]
+        vertices[a].add(b)
+        vertices[b].add(a)
+        values[(a, b)] = w
+        total += w
+    forest = Graph(vertices)
+    forest.set_edge_attributes(name, values)
+    return forest, total
+
+def _matrix(graph):
+    if graph._digraph:
+        raise NotImplementedError
+    return CSR.from_graph(graph)
+
+def kruskal(graph, weight="weight", default=1):
+    """ Minimum spanning forest with Kruskal's algorithm.
+
+    :param graph: A not directed graph.
+    :param weight: Name of the edge attribute holding the weights.
+    :param default: Weight of the edges without the attribute.
+    :return A pair (forest, total weight).
+    """
+    matrix = _matrix(graph)
+    column = graph.edge_attributes(weight)
+    vertices, offsets, targets = matrix.vertices, matrix.offsets, matrix.targets
+
+    # Every edge once (i < j), in three parallel arrays.
+    sources = array("l")
+    destinations = array("l")
+    weights = []
+    for i in range(matrix.order()):
+        row = column.get(vertices[i], {})
+        for k in range(offsets[i], offsets[i + 1]):
+            j = targets[k]
+            if i < j:
+                sources.append(i)
+                destinations.append(j)
+                weights.append(row.get(vertices[j], default))
+
+    parent = array("l", range(matrix.order()))
+    size = array("l", [1]) * matrix.order()
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    chosen = []
+    chosen_weights = []
+    remaining = matrix.order() - 1
+    for k in sorted(range(len(weights)), key=weights.__getitem__):
+        if remaining <= 0:
+            break
+        a, b = find(sources[k]), find(destinations[k])
+        if a != b:
+            if size[a] < size[b]:
+                a, b = b, a
+            parent[b] = a
+            size[a] += size[b]
+            chosen.append((sources[k], destinations[k]))
+            chosen_weights.append(weights[k])
+            remaining -= 1
+    return _forest(matrix, chosen, chosen_weights, weight)
+
+def prim(graph, weight="weight", default=1):
+    """ Minimum spanning forest with Prim's algorithm.
+
+    :param graph: A not directed graph.
+    :param weight: Name of the edge attribute holding the weights.
+    :param default: Weight of the edges without the attribute.
+    :return A pair (forest, total weight).
+    """
+    matrix = _matrix(graph)
+    column = graph.edge_attributes(weight)
+    vertices, offsets, targets = matrix.vertices, matrix.offsets, matrix.targets
+    n = matrix.order()
+    in_tree = bytearray(n)
+    chosen = []
+    chosen_weights = []
+
+    for root in range(n):
+        if in_tree[root]:
+            continue
+        heap = [(0, -1, root)]
+        while heap:
+            w, parent, i = heapq.heappop(heap)
+            if in_tree[i]:
+                continue
+            in_tree[i] = 1
+            if parent >= 0:
+                chosen.append((parent, i))
+                chosen_weights.append(w)
+            row = column.get(vertices[i], {})
+            for k in range(offsets[i], offsets[i + 1]):
+                j = targets[k]
+                if not in_tree[j]:
+                    heapq.heappush(heap, (row.get(vertices[j], default), i, j))
+    return _forest(matrix, chosen, chosen_weights, weight)
+
+def minimum_spanning_tree(graph, weight="weight", default=1, algorithm="kruskal"):
+    """ Minimum spanning forest with the given algorithm ("kruskal" or "prim").
+
+    :return A pair (forest, total weight).
+    """
+    if algorithm == "kruskal":
+        return kruskal(graph, weight, default)
+    if algorithm == "prim":
+        return prim(graph, weight, default)
+    raise ValueError("Unknown algorithm: %r" % algorithm)
@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+"""
+Lazy subgraph views over an existing Graph.
+
+A SubgraphView doesn't copy anything: it keeps a reference to the original
+graph and a filter, and filters the adjacency sets on the fly when they are
+read. Creating a view costs O(|filter|), reading the adjacency of a vertex
+costs O(degree). Views expose the whole read API of Graph (sucessors,
+adjacents_to, degree, order, the is_* checks...) and always reflect the
+current state of the original graph, attributes included. Attributes of
+vertices and edges hidden by the view aren't seen through it; the column
+getters (vertex_attributes, edge_attributes) return new, filtered
+dictionaries, in O(size of the column). Views can't be changed directly; use
+materialize() to get an independent Graph, attributes included.
+
+    community = induced_subgraph(graph, ["a", "b", "c"])
+    community.order()              # 3
+    community.adjacents_to("a")    # only neighbours inside the community
+    copy = community.materialize() # a new Graph
+
+=========================================
+
+Views:
+
+    SubgraphView induced_subgraph(graph, vertices)
+    SubgraphView vertex_filtered(graph, predicate)
+    SubgraphView edge_filtered(graph, edges)
+
+=========================================
+
+@license: MIT License
+"""
+
+from collections.abc import Mapping
+from graph import Graph, ReadOnlyGraph, _fingerprint
+
+class FilteredAdjacency(Mapping):
+    """ A read-only dictionary of vertices that filters the one of another graph.
+
+    Every lookup returns a new set, so callers may keep or change it freely.
+    """
+
+    def __init__(self, vertices, digraph, vertex_filter=None, edge_filter=None):
+        self._parent = vertices
+        self._digraph = digraph
+        self._vertex_filter = vertex_filter
+        self._edge_filter = edge_filter
+
+    def __contains__(self, vertex):
+        if vertex not in self._parent:
+            return False
+        if self._vertex_filter is None:
+            return True
+        if callable(self._vertex_filter):
+            return bool(self._vertex_filter(vertex))
+        return vertex in self._vertex_filter
+
+    def __getitem__(self, vertex):
+        if vertex not in self:
+            raise KeyError(vertex)
+        neighbours = self._parent[vertex]
+        if self._vertex_filter is None:
+            neighbours = set(neighbours)
+        elif callable(self._vertex_filter):
+            keep = self._vertex_filter
+            neighbours = set(v for v in neighbours if keep(v))
+        else:
+            neighbours = set(self._vertex_filter.intersection(neighbours))
+        if self._edge_filter is not None:
+            neighbours = set(v for v in neighbours if self.__keeps_edge(vertex, v))
+        return neighbours
+
+    def __iter__(self):
+        if self._vertex_filter is None or callable(self._vertex_filter):
+            return (v for v in self._parent if v in self)
+        return (v for v in self._vertex_filter if v in self._parent)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def has_edge(self, vertexA, vertexB):
+        """ Return True if the view keeps the edge from vertexA to vertexB, in O(1). """
+        if vertexA not in self or vertexB not in self:
+            return False
+        if isinstance(self._parent, FilteredAdjacency):
+            if not self._parent.has_edge(vertexA, vertexB):
+                return False
+        elif vertexB not in self._parent[vertexA]:
+            return False
+        return self._edge_filter is None or self.__keeps_edge(vertexA, vertexB)
+
+    def __keeps_edge(self, vertexA, vertexB):
+        if callable(self._edge_filter):
+            return bool(self._edge_filter(vertexA, vertexB))
+        if (vertexA, vertexB) in self._edge_filter:
+            return True
+        return (not self._digraph) and ((vertexB, vertexA) in self._edge_filter)
+
+class SubgraphView(ReadOnlyGraph):
+
+    def __init__(self, graph, vertices=None, edges=None):
+        """ Creates a new view over *graph*.
+
+        :param graph: The original graph (or another view).
+        :param vertices: Vertices kept by the view: an iterable of vertices, a function
+                         vertex -> bool, or None to keep every vertex.
+        :param edges: Edges kept by the view: an iterable of (vertexA, vertexB) pairs, a
+                      function (vertexA, vertexB) -> bool, or None to keep every edge
+                      between kept vertices. For not directed graphs a pair keeps the
+                      edge in both directions.
+        :return None
+        """
+        if vertices is not None and not callable(vertices):
+            vertices = frozenset(vertices)
+        if edges is not None and not callable(edges):
+            edges = frozenset(edges)
+        adjacency = FilteredAdjacency(graph._vertices, graph._digraph, vertices, edges)
+        ReadOnlyGraph.__init__(self, adjacency, graph._digraph)
+        self._graph = graph
+        self._vertex_attributes = graph._vertex_attributes
+        self._edge_attributes = graph._edge_attributes
+
+    def version(self):
+        """ Return the version of the original graph. """
+        return self._graph.version()
+
+    def fingerprint(self):
+        """ Return the fingerprint of the view (see Graph.fingerprint).
+
+        The view follows the changes of the original graph without being told about
+        them, so the fingerprint is computed again, in O(V + E), on every call.
+        """
+        return _fingerprint(self._vertices)
+
+    def vertex_attribute(self, vertex, name, default=None):
+        """ Same as Graph.vertex_attribute, *default* for vertices hidden by the view. """
+        if vertex not in self._vertices:
+            return default
+        return ReadOnlyGraph.vertex_attribute(self, vertex, name, default)
+
+    def vertex_attributes(self, name):
+        """ Return a new dictionary vertex -> value with the vertices of the view only. """
+        vertices = self._vertices
+        column = self._vertex_attributes.get(name, {})
+        return dict((v, value) for v, value in column.items() if v in vertices)
+
+    def edge_attribute(self, vertexA, vertexB, name, default=None):
+        """ Same as Graph.edge_attribute, *default* for edges hidden by the view. """
+        if not self._vertices.has_edge(vertexA, vertexB):
+            return default
+        return ReadOnlyGraph.edge_attribute(self, vertexA, vertexB, name, default)
+
+    def edge_attributes(self, name):
+        """ Return a new dictionary vertexA -> {vertexB: value} with the edges of the view only. """
+        has_edge = self._vertices.has_edge
+        result = {}
+        for vertexA, row in self._edge_attributes.get(name, {}).items():
+            kept = dict((vertexB, value) for vertexB, value in row.items() if has_edge(vertexA, vertexB))
+            if kept:
+                result[vertexA] = kept
+        return result
+
+    def materialize(self):
+        """ Copy the view into a new, independent Graph.
+
+        :return A Graph with the vertices, edges and attributes of the view.
+        """
+        graph = Graph(dict((v, self._vertices[v]) for v in self._vertices), self._digraph)
+        for name in self._vertex_attributes:
+            column = self.vertex_attributes(name)
+            if column:
+                graph._vertex_attributes[name] = column
+        for name in self._edge_attributes:
+            column = self.edge_attributes(name)
+            if column:
+                graph._edge_attributes[name] = column
+        return graph
+
+def induced_subgraph(graph, vertices):
+    """ View of *vertices* and every edge of *graph* between two of them.
+
+    :param graph: The original graph.
+    :param vertices: An iterable of vertices. Vertices not in *graph* are ignored.
+    :return A SubgraphView.
+    """
+    return SubgraphView(graph, vertices=vertices)
+
+def vertex_filtered(graph, predicate):
+    """ View of the vertices for which *predicate(vertex)* is true, and the edges between them.
+
+    :param graph: The original graph.
+    :param predicate: A function vertex -> bool, evaluated lazily.
+    :return A SubgraphView.
+    """
+    return SubgraphView(graph, vertices=predicate)
+
+def edge_filtered(graph, edges):
+    """ View of every vertex of *graph*, keeping only the given edges.
+
+    :param graph: The original graph.
+    :param edges: An iterable of (vertexA, vertexB) pairs or a function (vertexA, vertexB) -> bool.
+    :return A SubgraphView.
+    """
+    return SubgraphView(graph, edges=edges)
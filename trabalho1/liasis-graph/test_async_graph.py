@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+import asyncio
+import unittest
+import async_graph
+from graph import Graph
+
+def run(coroutine):
+	return asyncio.run(coroutine)
+
+def path(n):
+	vertices = dict((v, set()) for v in range(n))
+	for v in range(n - 1):
+		vertices[v].add(v + 1)
+		vertices[v + 1].add(v)
+	return Graph(vertices)
+
+class TestAsyncGraph(unittest.TestCase):
+
+	def test_bfs(self):
+		graph = Graph({
+			"a": set(["b"]),
+			"b": set(["c"]),
+			"c": set([]),
+			"d": set(["a"])
+		}, digraph=True)
+		self.assertEqual(run(async_graph.bfs(graph, "a")), ["a", "b", "c"])
+		self.assertEqual(run(async_graph.bfs(graph, "z")), [])
+
+	def test_transitive_closure(self):
+		graph = Graph({
+			"a": set(["b"]),
+			"b": set(["a"]),
+			"c": set(["e"]),
+			"d": set(["e"]),
+			"e": set(["c", "d"])
+		})
+		self.assertTrue(run(async_graph.transitive_closure(graph, "a")) == set(["a", "b"]))
+		self.assertTrue(run(async_graph.transitive_closure(graph, "e")) == set(["c", "d", "e"]))
+
+	def test_is_connected(self):
+		self.assertTrue(run(async_graph.is_connected(path(50), yield_every=7)))
+		graph = Graph({
+			"a": set(["b"]),
+			"b": set(["a"]),
+			"c": set([])
+		})
+		self.assertFalse(run(async_graph.is_connected(graph)))
+
+	def test_is_regular(self):
+		graph = Graph({
+			"a": set(["b", "d"]),
+			"b": set(["a", "c"]),
+			"c": set(["b", "d"]),
+			"d": set(["a", "c"])
+		})
+		self.assertTrue(run(async_graph.is_regular(graph, yield_every=1)))
+		self.assertFalse(run(async_graph.is_regular(path(5))))
+
+	def test_digraph_not_implemented(self):
+		graph = Graph({"a": set()}, digraph=True)
+		with self.assertRaises(NotImplementedError):
+			run(async_graph.is_connected(graph))
+
+	def test_yields_to_other_tasks(self):
+		ticks = []
+
+		async def ticker():
+			while True:
+				ticks.append(1)
+				await asyncio.sleep(0)
+
+		async def main():
+			task = asyncio.ensure_future(ticker())
+			await async_graph.bfs(path(1000), 0, yield_every=10)
+			task.cancel()
+
+		run(main())
+		self.assertTrue(len(ticks) >= 50)
+
+	def test_graph_changed_by_other_tasks(self):
+		graph = Graph(dict((v, set()) for v in range(100)))
+
+		async def mutate():
+			for v in range(100, 200):
+				graph.add(v)
+				graph.remove(v - 100)
+				await asyncio.sleep(0)
+
+		async def main():
+			task = asyncio.ensure_future(mutate())
+			regular = await async_graph.is_regular(graph, yield_every=1)
+			order = await async_graph.bfs(graph, 150, yield_every=1)
+			await task
+			return regular, order
+
+		regular, order = run(main())
+		self.assertTrue(regular)
+		self.assertEqual(order, [150])
+
+	def test_timeout(self):
+		with self.assertRaises(asyncio.TimeoutError):
+			run(async_graph.bfs(path(20000), 0, yield_every=1, timeout=0.0001))
+
+	def test_offload(self):
+		result = run(async_graph.offload(path(10), "order"))
+		self.assertEqual(result, 10)
+
+if __name__ == "__main__":
+	unittest.main()
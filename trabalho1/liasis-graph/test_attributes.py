@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+import unittest
+from graph import Graph, Vertex, Edge
+from graph_exceptions import ReadOnlyGraphError
+from subgraph import induced_subgraph
+
+class TestVertexAttributes(unittest.TestCase):
+
+	def setUp(self):
+		self.graph = Graph({
+			"a": set(["b"]),
+			"b": set(["a", "c"]),
+			"c": set(["b"])
+		})
+
+	def test_set_and_get(self):
+		self.graph.set_vertex_attribute("a", "age", 30)
+		self.assertEqual(self.graph.vertex_attribute("a", "age"), 30)
+		self.assertEqual(self.graph.vertex_attribute("b", "age"), None)
+		self.assertEqual(self.graph.vertex_attribute("b", "age", 0), 0)
+		self.assertEqual(self.graph.vertex_attribute("a", "name", "?"), "?")
+
+	def test_unknown_vertex_ignored(self):
+		self.graph.set_vertex_attribute("z", "age", 30)
+		self.assertEqual(self.graph.vertex_attributes("age"), {})
+
+	def test_bulk(self):
+		self.graph.set_vertex_attributes("age", {"a": 1, "b": 2, "z": 3})
+		self.assertEqual(self.graph.vertex_attributes("age"), {"a": 1, "b": 2})
+		self.assertEqual(self.graph.vertex_attributes("name"), {})
+
+	def test_remove_drops_attributes(self):
+		self.graph.set_vertex_attributes("age", {"a": 1, "b": 2})
+		self.graph.remove("a")
+		self.assertEqual(self.graph.vertex_attributes("age"), {"b": 2})
+		self.graph.add("a")
+		self.assertEqual(self.graph.vertex_attribute("a", "age"), None)
+
+	def test_vertex_record(self):
+		vertex = self.graph.vertex("a")
+		vertex["age"] = 5
+		self.assertEqual(self.graph.vertex_attribute("a", "age"), 5)
+		self.assertEqual(vertex["age"], 5)
+		self.assertEqual(vertex, Vertex(self.graph, "a"))
+		self.assertEqual(len(set([vertex, self.graph.vertex("a")])), 1)
+		self.assertEqual(self.graph.vertex("z"), None)
+		with self.assertRaises(AttributeError):
+			vertex.other = 1
+
+	def test_set_in_a_batch(self):
+		version = self.graph.version()
+		with self.graph.batch():
+			self.graph.add("d")
+			self.graph.set_vertex_attribute("d", "age", 4)
+			self.graph.set_vertex_attributes("name", {"d": "dee", "a": "ay"})
+			self.graph.remove("b")
+			self.graph.set_vertex_attribute("b", "age", 2)
+			self.assertEqual(self.graph.vertex_attribute("a", "name"), None)
+		self.assertEqual(self.graph.vertex_attributes("age"), {"d": 4})
+		self.assertEqual(self.graph.vertex_attributes("name"), {"d": "dee", "a": "ay"})
+		self.assertEqual(self.graph.version(), version + 1)
+
+	def test_unhashable_vertex_in_a_batch(self):
+		with self.assertRaises(TypeError):
+			with self.graph.batch():
+				self.graph.add("d")
+				self.graph.set_vertex_attribute([], "age", 1)
+		self.assertFalse("d" in self.graph.vertices())
+
+class TestEdgeAttributes(unittest.TestCase):
+
+	def setUp(self):
+		self.graph = Graph({
+			"a": set(["b"]),
+			"b": set(["a", "c"]),
+			"c": set(["b"])
+		})
+
+	def test_undirected_shared(self):
+		self.graph.set_edge_attribute("a", "b", "weight", 2.5)
+		self.assertEqual(self.graph.edge_attribute("b", "a", "weight"), 2.5)
+		self.assertEqual(self.graph.edge_attribute("b", "c", "weight"), None)
+		self.graph.set_edge_attribute("a", "c", "weight", 1)
+		self.assertEqual(self.graph.edge_attribute("a", "c", "weight"), None)
+
+	def test_digraph(self):
+		graph = Graph({"a": set(["b"]), "b": set(["a"])}, digraph=True)
+		graph.set_edge_attribute("a", "b", "capacity", 3)
+		self.assertEqual(graph.edge_attribute("a", "b", "capacity"), 3)
+		self.assertEqual(graph.edge_attribute("b", "a", "capacity"), None)
+		graph.remove("b")
+		self.assertEqual(graph.edge_attributes("capacity"), {"a": {}})
+
+	def test_bulk(self):
+		self.graph.set_edge_attributes("weight", {("a", "b"): 1, ("c", "b"): 2, ("a", "c"): 3})
+		column = self.graph.edge_attributes("weight")
+		self.assertEqual(column["b"], {"a": 1, "c": 2})
+
+	def test_disconnect_drops_attributes(self):
+		self.graph.set_edge_attribute("a", "b", "weight", 1)
+		self.graph.disconnect("b", "a")
+		self.graph.connect("a", "b")
+		self.assertEqual(self.graph.edge_attribute("a", "b", "weight"), None)
+
+	def test_set_in_a_batch(self):
+		with self.graph.batch():
+			self.graph.connect("a", "c")
+			self.graph.set_edge_attribute("a", "c", "weight", 5)
+			self.graph.set_edge_attributes("weight", {("b", "c"): [1, 2]})
+			self.graph.set_edge_attribute("a", "b", "weight", 3)
+			self.graph.disconnect("a", "b")
+		self.assertEqual(self.graph.edge_attribute("c", "a", "weight"), 5)
+		self.assertEqual(self.graph.edge_attribute("c", "b", "weight"), [1, 2])
+		self.assertEqual(self.graph.edge_attribute("a", "b", "weight"), None)
+		self.assertEqual([c[1] for c in self.graph.changes_since(0)], ["connect", "disconnect"])
+
+	def test_edge_records(self):
+		edges = list(self.graph.edges())
+		self.assertEqual(len(edges), 2)
+		edge = self.graph.edge("a", "b")
+		edge["weight"] = 7
+		self.assertEqual(self.graph.edge("b", "a")["weight"], 7)
+		self.assertEqual(edge, Edge(self.graph, "a", "b"))
+		self.assertEqual(self.graph.edge("a", "c"), None)
+		digraph = Graph({"a": set(["b"]), "b": set(["a"])}, digraph=True)
+		self.assertEqual(len(list(digraph.edges())), 2)
+
+	def test_views_share_attributes(self):
+		self.graph.set_vertex_attribute("a", "age", 1)
+		view = induced_subgraph(self.graph, ["a", "b"])
+		self.assertEqual(view.vertex_attribute("a", "age"), 1)
+		with self.assertRaises(ReadOnlyGraphError):
+			view.set_vertex_attribute("a", "age", 2)
+
+if __name__ == "__main__":
+	unittest.main()
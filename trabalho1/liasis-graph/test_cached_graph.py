@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+import unittest
+from cached_graph import CachedGraph
+from graph import Graph
+
+class TestCachedGraph(unittest.TestCase):
+
+	def setUp(self):
+		self.graph = CachedGraph({
+			"a": set(["b", "d"]),
+			"b": set(["a", "c"]),
+			"c": set(["b", "d"]),
+			"d": set(["a", "c"])
+		})
+
+	def test_results_are_cached(self):
+		self.assertTrue(self.graph.is_regular())
+		self.assertTrue(self.graph.is_regular())
+		self.assertTrue(self.graph.is_regular())
+		stats = self.graph.cache_stats()
+		self.assertEqual(stats["misses"], 1)
+		self.assertEqual(stats["hits"], 2)
+
+	def test_mutation_invalidates(self):
+		self.assertFalse(self.graph.is_complete())
+		self.graph.connect("a", "c")
+		self.graph.connect("b", "d")
+		self.assertTrue(self.graph.is_complete())
+		self.assertEqual(self.graph.cache_stats()["misses"], 2)
+
+	def test_noop_mutation_keeps_cache(self):
+		self.graph.is_complete()
+		self.graph.add("a")
+		self.graph.connect("a", "z")
+		self.assertFalse(self.graph.is_complete())
+		self.assertEqual(self.graph.cache_stats()["hits"], 1)
+
+	def test_vertices(self):
+		self.assertTrue(self.graph.vertices() == set(["a", "b", "c", "d"]))
+		self.graph.add("e")
+		self.assertTrue(self.graph.vertices() == set(["a", "b", "c", "d", "e"]))
+
+	def test_results_are_new_sets(self):
+		closure = self.graph.transitive_closure("a")
+		self.assertTrue(type(closure) is set)
+		closure.clear()
+		self.assertEqual(self.graph.transitive_closure("a"), Graph.transitive_closure(self.graph, "a"))
+
+	def test_closures_lru(self):
+		graph = CachedGraph(dict((v, set()) for v in range(5)), maxsize=2)
+		graph.transitive_closure(0)
+		graph.transitive_closure(1)
+		graph.transitive_closure(0)
+		graph.transitive_closure(2)
+		self.assertEqual(graph.cache_stats()["closures"], 2)
+		graph.transitive_closure(0)
+		self.assertEqual(graph.cache_stats()["hits"], 2)
+		graph.transitive_closure(1)
+		self.assertEqual(graph.cache_stats()["misses"], 4)
+
+	def test_cache_clear(self):
+		self.graph.is_regular()
+		self.graph.is_regular()
+		self.graph.cache_clear()
+		self.assertEqual(self.graph.cache_stats()["hits"], 0)
+		self.graph.is_regular()
+		self.assertEqual(self.graph.cache_stats()["misses"], 1)
+
+	def test_batch_invalidates_once(self):
+		self.assertTrue(self.graph.is_regular())
+		with self.graph.batch():
+			self.graph.add("e")
+			self.graph.connect("e", "a")
+			self.assertTrue(self.graph.is_regular())
+		self.assertFalse(self.graph.is_regular())
+
+if __name__ == "__main__":
+	unittest.main()
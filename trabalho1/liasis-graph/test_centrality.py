@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+import unittest
+import centrality
+import workers
+from csr import CSR
+from graph import Graph
+
+def path():
+	return Graph({
+		"a": set(["b"]),
+		"b": set(["a", "c"]),
+		"c": set(["b"])
+	})
+
+class TestCSR(unittest.TestCase):
+
+	def test_from_graph(self):
+		matrix = CSR.from_graph(path())
+		self.assertEqual(matrix.order(), 3)
+		self.assertEqual(matrix.size(), 4)
+		b = matrix.index["b"]
+		neighbours = set(matrix.vertices[i] for i in matrix.neighbours(b))
+		self.assertTrue(neighbours == set(["a", "c"]))
+
+	def test_reverse(self):
+		graph = Graph({
+			"a": set(["b", "c"]),
+			"b": set(["c"]),
+			"c": set([])
+		}, digraph=True)
+		matrix = CSR.from_graph(graph).reverse()
+		c = matrix.index["c"]
+		predecessors = set(matrix.vertices[i] for i in matrix.neighbours(c))
+		self.assertTrue(predecessors == set(["a", "b"]))
+		self.assertEqual(list(matrix.degrees()), [graph.in_degree(v) for v in matrix.vertices])
+
+class TestCentrality(unittest.TestCase):
+
+	def test_degree_centrality(self):
+		scores = centrality.degree_centrality(path())
+		self.assertEqual(scores, {"a": 0.5, "b": 1.0, "c": 0.5})
+
+	def test_pagerank_uniform_on_cycle(self):
+		graph = Graph(dict((v, set([(v + 1) % 4, (v - 1) % 4])) for v in range(4)))
+		ranks = centrality.pagerank(graph)
+		for v in range(4):
+			self.assertAlmostEqual(ranks[v], 0.25)
+
+	def test_pagerank_star(self):
+		graph = Graph({
+			"hub": set(["a", "b", "c"]),
+			"a": set(["hub"]),
+			"b": set(["hub"]),
+			"c": set(["hub"])
+		})
+		ranks = centrality.pagerank(graph, tolerance=1.0e-10)
+		self.assertAlmostEqual(sum(ranks.values()), 1.0)
+		self.assertTrue(ranks["hub"] > ranks["a"])
+		self.assertAlmostEqual(ranks["a"], ranks["b"])
+
+	def test_pagerank_dangling(self):
+		graph = Graph({"a": set(["b"]), "b": set()}, digraph=True)
+		ranks = centrality.pagerank(graph, tolerance=1.0e-10)
+		self.assertAlmostEqual(sum(ranks.values()), 1.0)
+		self.assertTrue(ranks["b"] > ranks["a"])
+
+	def test_betweenness(self):
+		self.assertEqual(centrality.betweenness(path()), {"a": 0.0, "b": 1.0, "c": 0.0})
+		graph = Graph({"a": set(["b"]), "b": set(["c"]), "c": set()}, digraph=True)
+		self.assertEqual(centrality.betweenness(graph), {"a": 0.0, "b": 1.0, "c": 0.0})
+
+	def test_betweenness_with_processes(self):
+		graph = Graph(dict((v, set([(v + 1) % 9, (v - 1) % 9])) for v in range(9)))
+		serial = centrality.betweenness(graph)
+		parallel = centrality.betweenness(graph, processes=2)
+		for v in range(9):
+			self.assertAlmostEqual(serial[v], parallel[v])
+
+	def test_sampled_betweenness(self):
+		scores = centrality.betweenness(path(), samples=3, seed=1)
+		self.assertEqual(scores, centrality.betweenness(path()))
+		scores = centrality.betweenness(path(), samples=2, seed=1)
+		self.assertEqual(scores["a"], 0.0)
+
+	def test_closeness(self):
+		scores = centrality.closeness(path())
+		self.assertAlmostEqual(scores["b"], 1.0)
+		self.assertAlmostEqual(scores["a"], 2.0 / 3.0)
+		self.assertEqual(list(centrality.closeness(path(), vertices=["c", "z"])), ["c"])
+
+	def test_serial_run_keeps_no_state(self):
+		workers.initialize(None)
+		centrality.betweenness(path())
+		centrality.closeness(path())
+		self.assertTrue(workers.state is None)
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+import unittest
+from graph import Graph
+
+class TestChangeLog(unittest.TestCase):
+
+	def test_version_starts_at_zero(self):
+		graph = Graph({}, digraph=True)
+		self.assertEqual(graph.version(), 0)
+		self.assertEqual(graph.changes_since(0), [])
+
+	def test_mutations_bump_version(self):
+		graph = Graph({})
+		graph.add("a")
+		graph.add("b")
+		graph.connect("a", "b")
+		self.assertEqual(graph.version(), 3)
+		graph.disconnect("a", "b")
+		graph.remove("b")
+		self.assertEqual(graph.version(), 5)
+
+	def test_noop_mutations_dont_bump_version(self):
+		graph = Graph({})
+		graph.add("a")
+		graph.add("a")
+		graph.connect("a", "z")
+		graph.disconnect("a", "z")
+		graph.remove("z")
+		self.assertEqual(graph.version(), 1)
+		self.assertEqual(len(graph.changes_since(0)), 1)
+
+	def test_changes_since(self):
+		graph = Graph({}, digraph=True)
+		graph.add("a")
+		graph.add("b")
+		version = graph.version()
+		graph.connect("a", "b")
+		graph.remove("a")
+		self.assertEqual(graph.changes_since(version), [
+			(3, "connect", ("a", "b")),
+			(4, "disconnect", ("a", "b")),
+			(4, "remove", ("a",))
+		])
+		self.assertEqual(graph.changes_since(graph.version()), [])
+
+	def test_graphs_dont_share_the_default_dictionary(self):
+		first, second = Graph(), Graph()
+		first.add(1)
+		self.assertEqual(second.order(), 0)
+		self.assertEqual(second.version(), 0)
+
+class TestBatch(unittest.TestCase):
+
+	def test_batch_applies_at_the_end(self):
+		graph = Graph({})
+		with graph.batch():
+			graph.add("a")
+			graph.add("b")
+			graph.connect("a", "b")
+			self.assertEqual(graph.order(), 0)
+		self.assertEqual(graph.order(), 2)
+		self.assertTrue(graph.adjacents_to("a") == set(["b"]))
+
+	def test_batch_shares_a_single_version(self):
+		graph = Graph({})
+		with graph.batch():
+			graph.add("a")
+			graph.add("b")
+			graph.connect("a", "b")
+		self.assertEqual(graph.version(), 1)
+		self.assertEqual([change[0] for change in graph.changes_since(0)], [1, 1, 1])
+
+	def test_nested_batch(self):
+		graph = Graph({})
+		with graph.batch():
+			graph.add("a")
+			with graph.batch():
+				graph.add("b")
+			self.assertEqual(graph.order(), 0)
+		self.assertEqual(graph.order(), 2)
+		self.assertEqual(graph.version(), 1)
+
+	def test_batch_discarded_on_exception(self):
+		graph = Graph({})
+		with self.assertRaises(ValueError):
+			with graph.batch():
+				graph.add("a")
+				raise ValueError("abort")
+		self.assertEqual(graph.order(), 0)
+		self.assertEqual(graph.version(), 0)
+		graph.add("a")
+		self.assertEqual(graph.order(), 1)
+
+	def test_invalid_batch_is_not_applied(self):
+		graph = Graph({})
+		with self.assertRaises(TypeError):
+			with graph.batch():
+				graph.add("a")
+				graph.add(["x"])
+		self.assertEqual(graph.order(), 0)
+		self.assertEqual(graph.version(), 0)
+		self.assertEqual(graph.changes_since(0), [])
+		graph.add("b")
+		self.assertEqual(graph.changes_since(0), [(1, "add", ("b",))])
+
+	def test_remove_logs_its_edges(self):
+		graph = Graph(dict((v, set()) for v in "abc"))
+		graph.connect("a", "b")
+		graph.connect("b", "c")
+		version = graph.version()
+		graph.remove("b")
+		changes = graph.changes_since(version)
+		self.assertEqual(changes[-1], (version + 1, "remove", ("b",)))
+		self.assertEqual(sorted(changes[:-1]), [
+			(version + 1, "disconnect", ("b", "a")),
+			(version + 1, "disconnect", ("b", "c"))
+		])
+
+	def test_remove_logs_its_arcs(self):
+		graph = Graph({"a": set(["b"]), "b": set(["c", "b"]), "c": set()}, digraph=True)
+		graph.remove("b")
+		self.assertEqual(sorted(change[1:] for change in graph.changes_since(0)), [
+			("disconnect", ("a", "b")),
+			("disconnect", ("b", "b")),
+			("disconnect", ("b", "c")),
+			("remove", ("b",))
+		])
+		self.assertEqual(graph.changes_since(0)[-1][1], "remove")
+
+if __name__ == "__main__":
+	unittest.main()
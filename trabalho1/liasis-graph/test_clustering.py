@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+import random
+import unittest
+import clustering
+from graph import Graph
+
+def diamond():
+	# Two triangles (a, b, c) and (b, c, d) sharing the edge b-c, plus a pendant e.
+	return Graph({
+		"a": set(["b", "c"]),
+		"b": set(["a", "c", "d"]),
+		"c": set(["a", "b", "d"]),
+		"d": set(["b", "c", "e"]),
+		"e": set(["d"])
+	})
+
+def complete(n):
+	return Graph(dict((v, set(u for u in range(n) if u != v)) for v in range(n)))
+
+class TestTriangles(unittest.TestCase):
+
+	def test_triangles(self):
+		self.assertEqual(clustering.triangles(diamond()), 2)
+		self.assertEqual(clustering.triangles(complete(6)), 20)
+
+	def test_local_triangles(self):
+		counts = clustering.local_triangles(diamond())
+		self.assertEqual(counts, {"a": 1, "b": 2, "c": 2, "d": 1, "e": 0})
+
+	def test_self_loops_ignored(self):
+		graph = Graph({"a": set(["a", "b"]), "b": set(["a"])})
+		self.assertEqual(clustering.triangles(graph), 0)
+
+	def test_matches_naive_count(self):
+		rnd = random.Random(3)
+		vertices = dict((v, set()) for v in range(40))
+		for _ in range(200):
+			a, b = rnd.randrange(40), rnd.randrange(40)
+			if a != b:
+				vertices[a].add(b)
+				vertices[b].add(a)
+		naive = 0
+		for a in vertices:
+			for b in vertices[a]:
+				naive += len(vertices[a] & vertices[b])
+		self.assertEqual(clustering.triangles(Graph(vertices)), naive // 6)
+
+	def test_digraph_not_implemented(self):
+		with self.assertRaises(NotImplementedError):
+			clustering.triangles(Graph({"a": set()}, digraph=True))
+
+class TestClustering(unittest.TestCase):
+
+	def test_local_clustering(self):
+		coefficients = clustering.local_clustering(diamond())
+		self.assertAlmostEqual(coefficients["a"], 1.0)
+		self.assertAlmostEqual(coefficients["b"], 2.0 / 3.0)
+		self.assertAlmostEqual(coefficients["d"], 1.0 / 3.0)
+		self.assertAlmostEqual(coefficients["e"], 0.0)
+
+	def test_average_clustering(self):
+		self.assertAlmostEqual(clustering.average_clustering(complete(5)), 1.0)
+		expected = (1.0 + 2.0 / 3.0 + 2.0 / 3.0 + 1.0 / 3.0 + 0.0) / 5
+		self.assertAlmostEqual(clustering.average_clustering(diamond()), expected)
+
+	def test_transitivity(self):
+		self.assertAlmostEqual(clustering.transitivity(complete(5)), 1.0)
+		self.assertAlmostEqual(clustering.transitivity(diamond()), 6.0 / 10.0)
+		self.assertEqual(clustering.transitivity(Graph({})), 0.0)
+
+class TestCores(unittest.TestCase):
+
+	def test_core_numbers(self):
+		cores = clustering.core_numbers(diamond())
+		self.assertEqual(cores, {"a": 2, "b": 2, "c": 2, "d": 2, "e": 1})
+		cores = clustering.core_numbers(complete(5))
+		self.assertEqual(set(cores.values()), set([4]))
+
+	def test_k_core(self):
+		self.assertTrue(clustering.k_core(diamond(), 2) == set(["a", "b", "c", "d"]))
+		self.assertTrue(clustering.k_core(diamond(), 3) == set())
+		self.assertEqual(clustering.core_numbers(Graph({})), {})
+
+if __name__ == "__main__":
+	unittest.main()
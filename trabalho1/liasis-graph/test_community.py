@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+import unittest
+import community
+from graph import Graph
+
+def two_cliques():
+	# Two cliques of five vertices joined by the single edge 0-5.
+	vertices = dict((v, set()) for v in range(10))
+	for group in (range(5), range(5, 10)):
+		for a in group:
+			for b in group:
+				if a != b:
+					vertices[a].add(b)
+	vertices[0].add(5)
+	vertices[5].add(0)
+	return Graph(vertices)
+
+def expected():
+	return sorted([set(range(5)), set(range(5, 10))], key=min)
+
+class TestCommunity(unittest.TestCase):
+
+	def test_label_propagation(self):
+		partition = community.label_propagation(two_cliques(), seed=1)
+		self.assertEqual(sorted(community.communities(partition), key=min), expected())
+		self.assertEqual(partition[1].typecode, "l")
+
+	def test_label_propagation_with_processes(self):
+		partition = community.label_propagation(two_cliques(), seed=1, processes=2)
+		self.assertEqual(len(partition[1]), 10)
+		self.assertTrue(community.modularity(two_cliques(), partition) > 0.0)
+
+	def test_louvain(self):
+		partition = community.louvain(two_cliques(), seed=1)
+		self.assertEqual(sorted(community.communities(partition), key=min), expected())
+
+	def test_louvain_with_processes(self):
+		partition = community.louvain(two_cliques(), seed=1, processes=2)
+		self.assertEqual(sorted(community.communities(partition), key=min), expected())
+
+	def test_modularity(self):
+		graph = two_cliques()
+		vertices = list(range(10))
+		together = (vertices, [0] * 10)
+		split = (vertices, [0] * 5 + [1] * 5)
+		self.assertAlmostEqual(community.modularity(graph, together), 0.0)
+		self.assertAlmostEqual(community.modularity(graph, split), 40.0 / 42 - 0.5)
+
+	def test_isolated_vertices(self):
+		graph = Graph({"a": set(), "b": set()})
+		vertices, labels = community.louvain(graph)
+		self.assertEqual(len(set(labels)), 2)
+		vertices, labels = community.label_propagation(graph)
+		self.assertEqual(len(set(labels)), 2)
+
+	def test_digraph_not_implemented(self):
+		with self.assertRaises(NotImplementedError):
+			community.louvain(Graph({"a": set()}, digraph=True))
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+import threading
+import unittest
+from concurrent_graph import ConcurrentGraph
+from graph_exceptions import ReadOnlyGraphError
+
+class TestConcurrentGraph(unittest.TestCase):
+
+	def test_construct_with_params(self):
+		vertices = {
+			"a": set(["b", "d"]),
+			"b": set(["a"]),
+			"c": set([]),
+			"d": set(["a"]),
+			"e": set([])
+		}
+		graph = ConcurrentGraph(vertices)
+		vertices["a"].add("c")
+		self.assertEqual(graph.order(), 5)
+		self.assertEqual(graph.degree("a"), 2)
+		self.assertEqual(graph.version(), 0)
+
+	def test_batch_publishes_a_single_version(self):
+		graph = ConcurrentGraph()
+		with graph.batch() as writer:
+			writer.add("a")
+			writer.add("b")
+			writer.connect("a", "b")
+			self.assertEqual(graph.order(), 0)
+		self.assertEqual(graph.order(), 2)
+		self.assertEqual(graph.version(), 1)
+		self.assertTrue(graph.adjacents_to("b") == set(["a"]))
+
+	def test_noop_batch_doesnt_publish(self):
+		graph = ConcurrentGraph({"a": set()})
+		with graph.batch() as writer:
+			writer.add("a")
+			writer.connect("a", "z")
+		self.assertEqual(graph.version(), 0)
+
+	def test_snapshot_is_immutable(self):
+		graph = ConcurrentGraph({"a": set(["b"]), "b": set(["a"])})
+		snapshot = graph.snapshot()
+		graph.remove("b")
+		graph.add("c")
+		self.assertEqual(snapshot.order(), 2)
+		self.assertTrue(snapshot.adjacents_to("a") == set(["b"]))
+		self.assertTrue(graph.adjacents_to("a") == set())
+		self.assertTrue(graph.vertices() == set(["a", "c"]))
+		with self.assertRaises(ReadOnlyGraphError):
+			snapshot.add("d")
+
+	def test_digraph(self):
+		graph = ConcurrentGraph(digraph=True)
+		with graph.batch() as writer:
+			for v in "abc":
+				writer.add(v)
+			writer.connect("a", "b")
+			writer.connect("c", "b")
+		self.assertTrue(graph.predecessors("b") == set(["a", "c"]))
+		graph.remove("b")
+		self.assertEqual(graph.out_degree("a"), 0)
+		self.assertEqual(graph.out_degree("c"), 0)
+
+	def test_batch_discarded_on_exception(self):
+		graph = ConcurrentGraph()
+		with self.assertRaises(ValueError):
+			with graph.batch() as writer:
+				writer.add("a")
+				raise ValueError("abort")
+		self.assertEqual(graph.order(), 0)
+		self.assertEqual(graph.version(), 0)
+
+	def test_nested_batches_join_the_outer_one(self):
+		graph = ConcurrentGraph()
+
+		def write():
+			with graph.batch() as writer:
+				writer.add("a")
+				graph.add("b")
+				with graph.batch() as inner:
+					self.assertTrue(inner is writer)
+					inner.connect("a", "b")
+				self.assertEqual(graph.order(), 0)
+
+		thread = threading.Thread(target=write)
+		thread.start()
+		thread.join(5)
+		self.assertFalse(thread.is_alive())
+		self.assertEqual(graph.version(), 1)
+		self.assertEqual(graph.adjacents_to("a"), frozenset(["b"]))
+		graph.add("c")
+		self.assertEqual(graph.version(), 2)
+
+	def test_writer_is_closed_after_the_batch(self):
+		graph = ConcurrentGraph()
+		with graph.batch() as writer:
+			writer.add("a")
+		snapshot = graph.snapshot()
+		for call in (lambda: writer.add("z"), lambda: writer.remove("a"),
+				lambda: writer.connect("a", "a"), lambda: writer.disconnect("a", "a")):
+			self.assertRaises(ReadOnlyGraphError, call)
+		self.assertEqual(snapshot.order(), 1)
+		with self.assertRaises(ValueError):
+			with graph.batch() as aborted:
+				raise ValueError("abort")
+		self.assertRaises(ReadOnlyGraphError, aborted.add, "z")
+		graph.add("b")
+		self.assertEqual(graph.order(), 2)
+
+	def test_readers_see_consistent_versions(self):
+		graph = ConcurrentGraph(dict((v, set()) for v in range(10)))
+		errors = []
+
+		def read():
+			for _ in range(2000):
+				snapshot = graph.snapshot()
+				for v in snapshot.vertices():
+					for u in snapshot.adjacents_to(v):
+						if v not in snapshot.adjacents_to(u):
+							errors.append((v, u))
+
+		readers = [threading.Thread(target=read) for _ in range(4)]
+		for t in readers:
+			t.start()
+		for i in range(200):
+			with graph.batch() as writer:
+				writer.connect(i % 10, (i * 7) % 10)
+				writer.disconnect((i + 3) % 10, (i * 3) % 10)
+		for t in readers:
+			t.join()
+		self.assertEqual(errors, [])
+
+	def test_snapshots_share_the_base(self):
+		graph = ConcurrentGraph(dict((v, set()) for v in range(10000)))
+		first = graph.snapshot()
+		graph.connect(1, 2)
+		graph.remove(3)
+		graph.add(3)
+		second = graph.snapshot()
+		self.assertTrue(second._vertices._base is first._vertices)
+		self.assertEqual(second.order(), 10000)
+		self.assertEqual(second.adjacents_to(1), frozenset([2]))
+		self.assertEqual(first.adjacents_to(1), frozenset())
+		self.assertEqual(set(second.vertices()), set(range(10000)))
+
+	def test_overlay_is_compacted(self):
+		graph = ConcurrentGraph(dict((v, set()) for v in range(1000)))
+		first = graph.snapshot()
+		for v in range(0, 400, 2):
+			graph.connect(v, v + 1)
+		for v in range(500, 600):
+			graph.remove(v)
+		snapshot = graph.snapshot()
+		self.assertTrue(isinstance(snapshot._vertices, dict) or
+			len(snapshot._vertices._delta) + len(snapshot._vertices._removed) <= 64)
+		self.assertEqual(snapshot.order(), 900)
+		self.assertEqual(snapshot.adjacents_to(398), frozenset([399]))
+		self.assertEqual(first.order(), 1000)
+		self.assertEqual(first.adjacents_to(398), frozenset())
+
+if __name__ == "__main__":
+	unittest.main()
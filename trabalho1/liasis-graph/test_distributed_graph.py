@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+import unittest
+from distributed_graph import PartitionedGraph, Partitioner
+from graph import Graph
+
+def path(n):
+	vertices = dict((v, set()) for v in range(n))
+	for v in range(n - 1):
+		vertices[v].add(v + 1)
+		vertices[v + 1].add(v)
+	return Graph(vertices)
+
+class TestPartitioner(unittest.TestCase):
+
+	def test_hash(self):
+		partitioner = Partitioner(3)
+		owners = set(partitioner.owner(v) for v in range(100))
+		self.assertTrue(owners == set([0, 1, 2]))
+		self.assertEqual(partitioner.owner("a"), Partitioner(3).owner("a"))
+
+	def test_range(self):
+		partitioner = Partitioner(2, "range", range(10))
+		self.assertEqual([partitioner.owner(v) for v in range(10)], [0] * 5 + [1] * 5)
+
+	def test_unknown(self):
+		with self.assertRaises(ValueError):
+			Partitioner(2, "round-robin")
+
+class TestPartitionedGraph(unittest.TestCase):
+
+	def test_bfs(self):
+		with PartitionedGraph(path(20), workers=3) as graph:
+			self.assertEqual(graph.order(), 20)
+			self.assertEqual(graph.bfs(0), dict((v, v) for v in range(20)))
+			self.assertEqual(graph.bfs(50), {})
+
+	def test_bfs_range(self):
+		with PartitionedGraph(path(20), workers=2, partition="range") as graph:
+			levels = graph.bfs(10)
+			self.assertEqual(levels[0], 10)
+			self.assertEqual(levels[19], 9)
+
+	def test_digraph(self):
+		source = Graph({
+			"a": set(["b"]),
+			"b": set(["c"]),
+			"c": set([]),
+			"d": set(["a"])
+		}, digraph=True)
+		with PartitionedGraph(source, workers=2) as graph:
+			self.assertEqual(graph.bfs("a"), {"a": 0, "b": 1, "c": 2})
+			with self.assertRaises(NotImplementedError):
+				graph.is_connected()
+
+	def test_is_connected(self):
+		with PartitionedGraph(path(10), workers=2) as graph:
+			self.assertTrue(graph.is_connected())
+		disconnected = path(10)
+		disconnected.disconnect(4, 5)
+		with PartitionedGraph(disconnected, workers=2) as graph:
+			self.assertFalse(graph.is_connected())
+
+	def test_none_vertex(self):
+		with PartitionedGraph(Graph({None: set()}), workers=2) as graph:
+			self.assertTrue(graph.is_connected())
+
+	def test_equal_vertices_have_one_owner(self):
+		vertices = dict((v, set()) for v in range(20))
+		for v in range(19):
+			vertices[v].add(float(v + 1))
+			vertices[v + 1].add(float(v))
+		with PartitionedGraph(Graph(vertices), workers=3) as graph:
+			self.assertTrue(graph.is_connected())
+			self.assertEqual(graph.bfs(0.0), dict((v, v) for v in range(20)))
+
+	def test_complete_graph(self):
+		vertices = dict((v, set(range(30)) - set([v])) for v in range(30))
+		with PartitionedGraph(Graph(vertices), workers=3) as graph:
+			levels = graph.bfs(0)
+			self.assertEqual(len(levels), 30)
+			self.assertEqual(max(levels.values()), 1)
+
+	def test_unsupported_vertices(self):
+		class Vertex(object):
+			def __init__(self, label):
+				self.label = label
+			def __eq__(self, other):
+				return self.label == other.label
+			def __hash__(self):
+				return hash(self.label)
+		with self.assertRaises(TypeError):
+			PartitionedGraph(Graph({Vertex(1): set(), Vertex(2): set()}), workers=2)
+
+if __name__ == "__main__":
+	unittest.main()
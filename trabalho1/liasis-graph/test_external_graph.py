@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+import json
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+from external_graph import ExternalGraph, shard_of
+from graph import Graph
+from graph_exceptions import DigraphError, NotDigraphError
+
+class TestExternalGraph(unittest.TestCase):
+
+	def setUp(self):
+		self.directory = tempfile.mkdtemp()
+
+	def tearDown(self):
+		shutil.rmtree(self.directory)
+
+	def test_build(self):
+		graph = ExternalGraph.build(self.directory, [("a", "b"), ("b", "c"), ("a", "d")],
+			vertices=["e"], shards=3)
+		self.assertEqual(graph.order(), 5)
+		self.assertTrue(graph.vertices() == set(["a", "b", "c", "d", "e"]))
+		self.assertTrue(graph.adjacents_to("a") == set(["b", "d"]))
+		self.assertTrue(graph.adjacents_to("b") == set(["a", "c"]))
+		self.assertTrue(graph.adjacents_to("z") == set())
+		self.assertEqual(graph.degree("e"), 0)
+		with self.assertRaises(NotDigraphError):
+			graph.sucessors("a")
+
+	def test_reopen(self):
+		ExternalGraph.build(self.directory, [("a", "b")], shards=2).close()
+		graph = ExternalGraph(self.directory)
+		self.assertTrue(graph.adjacents_to("b") == set(["a"]))
+
+	def test_none_vertex(self):
+		graph = ExternalGraph.build(self.directory, [("a", None)], vertices=[None], shards=2)
+		self.assertTrue(graph.adjacents_to("a") == set([None]))
+		self.assertTrue(graph.adjacents_to(None) == set(["a"]))
+		graph.close()
+		shutil.rmtree(self.directory)
+		graph = ExternalGraph.build(self.directory, [("a", None), (None, "b")], digraph=True, shards=2)
+		self.assertTrue(graph.vertices() == set(["a", "b", None]))
+		self.assertTrue(graph.sucessors("a") == set([None]))
+		self.assertTrue(graph.sucessors(None) == set(["b"]))
+		self.assertTrue(graph.sucessors("b") == set())
+
+	def test_digraph(self):
+		source = Graph({
+			"a": set(["b", "c"]),
+			"b": set(["c"]),
+			"c": set([]),
+			"d": set(["a"])
+		}, digraph=True)
+		graph = ExternalGraph.from_graph(self.directory, source, shards=4)
+		for v in "abcd":
+			self.assertTrue(graph.sucessors(v) == source.sucessors(v))
+			self.assertTrue(graph.predecessors(v) == source.predecessors(v))
+			self.assertEqual(graph.in_degree(v), source.in_degree(v))
+		with self.assertRaises(DigraphError):
+			graph.adjacents_to("a")
+
+	def test_bfs(self):
+		edges = [(i, i + 1) for i in range(99)]
+		graph = ExternalGraph.build(self.directory, edges, shards=8)
+		self.assertEqual(graph.bfs(0), list(range(100)))
+		self.assertEqual(graph.bfs(500), [])
+		order = graph.bfs(50)
+		self.assertEqual(order[0], 50)
+		self.assertTrue(set(order[1:3]) == set([49, 51]))
+
+	def test_cache_statistics(self):
+		edges = [(i, i + 1) for i in range(99)]
+		graph = ExternalGraph.build(self.directory, edges, shards=8)
+		graph.reset_stats()
+		graph.adjacents_to(1)
+		first = graph.last_query_stats()
+		self.assertEqual(first["misses"], 1)
+		self.assertTrue(first["bytes_read"] > 0)
+		graph.adjacents_to(1)
+		second = graph.last_query_stats()
+		self.assertEqual(second["hits"], 1)
+		self.assertEqual(second["bytes_read"], 0)
+		self.assertEqual(second["hit_rate"], 1.0)
+		self.assertEqual(graph.stats()["hit_rate"], 0.5)
+
+	def test_memory_budget(self):
+		edges = [(i, i + 1) for i in range(999)]
+		graph = ExternalGraph.build(self.directory, edges, shards=16, memory_budget=1)
+		self.assertEqual(len(graph.bfs(0)), 1000)
+		self.assertTrue(graph.stats()["cached_bytes"] <= max(graph._sizes.values()))
+
+	def test_memory_size(self):
+		edges = [(i, i + 1) for i in range(999)]
+		graph = ExternalGraph.build(self.directory, edges, shards=4)
+		self.assertTrue(graph.memory_size() > graph.disk_size())
+		graph.vertices()
+		self.assertEqual(graph.stats()["cached_bytes"], graph.memory_size())
+
+	def test_equal_vertices_share_a_shard(self):
+		for shards in (7, 64):
+			self.assertEqual(shard_of(1, shards), shard_of(1.0, shards))
+			self.assertEqual(shard_of(1, shards), shard_of(True, shards))
+			self.assertEqual(shard_of(("a", 2), shards), shard_of(("a", 2.0), shards))
+			self.assertEqual(shard_of(frozenset([1, "b"]), shards), shard_of(frozenset(["b", 1]), shards))
+		graph = ExternalGraph.build(self.directory, [(1, 2), (2, 3)], shards=16)
+		self.assertTrue(graph.adjacents_to(1.0) == set([2]))
+		self.assertEqual(sorted(graph.bfs(1.0)), [1, 2, 3])
+
+	def test_bfs_missing_entry(self):
+		ExternalGraph.build(self.directory, [("a", "b"), ("b", "c")], shards=4).close()
+		path = os.path.join(self.directory, "segment-%05d.pickle" % shard_of("c", 4))
+		with open(path, "rb") as f:
+			segment = pickle.load(f)
+		del segment["c"]
+		with open(path, "wb") as f:
+			pickle.dump(segment, f)
+		self.assertEqual(ExternalGraph(self.directory).bfs("a"), ["a", "b", "c"])
+
+	def test_unsupported_vertices(self):
+		class Vertex(object):
+			def __init__(self, label):
+				self.label = label
+			def __eq__(self, other):
+				return self.label == other.label
+			def __hash__(self):
+				return hash(self.label)
+		with self.assertRaises(TypeError):
+			ExternalGraph.build(self.directory, [(Vertex(1), Vertex(2))], shards=4)
+
+	def test_unknown_format(self):
+		ExternalGraph.build(self.directory, [("a", "b")], shards=2).close()
+		path = os.path.join(self.directory, "meta.json")
+		with open(path) as f:
+			meta = json.load(f)
+		del meta["format"]
+		with open(path, "w") as f:
+			json.dump(meta, f)
+		with self.assertRaises(ValueError):
+			ExternalGraph(self.directory)
+
+if __name__ == "__main__":
+	unittest.main()
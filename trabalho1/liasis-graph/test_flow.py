@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+import unittest
+import flow
+from graph import Graph
+
+def network():
+	# Classic example (CLRS 26.1): maximum flow 23.
+	graph = Graph(dict((v, set()) for v in ["s", "v1", "v2", "v3", "v4", "t"]), digraph=True)
+	capacities = {
+		("s", "v1"): 16, ("s", "v2"): 13, ("v2", "v1"): 4, ("v1", "v3"): 12,
+		("v3", "v2"): 9, ("v2", "v4"): 14, ("v4", "v3"): 7, ("v3", "t"): 20,
+		("v4", "t"): 4
+	}
+	for a, b in capacities:
+		graph.connect(a, b)
+	graph.set_edge_attributes("capacity", capacities)
+	return graph
+
+class TestHopcroftKarp(unittest.TestCase):
+
+	def test_perfect_matching(self):
+		graph = Graph({
+			"w1": set(["j1", "j2"]),
+			"w2": set(["j1"]),
+			"w3": set(["j2", "j3"]),
+			"j1": set(), "j2": set(), "j3": set()
+		}, digraph=True)
+		matching = flow.hopcroft_karp(graph, ["w1", "w2", "w3"])
+		self.assertEqual(matching, {"w1": "j2", "w2": "j1", "w3": "j3"})
+
+	def test_maximum_matching(self):
+		graph = Graph({
+			"w1": set(["j1"]),
+			"w2": set(["j1"]),
+			"w3": set(["j1", "j2"]),
+			"j1": set(["w1", "w2", "w3"]),
+			"j2": set(["w3"])
+		})
+		matching = flow.hopcroft_karp(graph, ["w1", "w2", "w3"])
+		self.assertEqual(len(matching), 2)
+		self.assertEqual(matching["w3"], "j2")
+		self.assertEqual(len(set(matching.values())), 2)
+
+	def test_long_augmenting_path(self):
+		n = 3000
+		vertices = {}
+		for i in range(n):
+			vertices[("l", i)] = set([("r", i)] + ([("r", i + 1)] if i + 1 < n else []))
+			vertices[("r", i)] = set()
+		graph = Graph(vertices, digraph=True)
+		matching = flow.hopcroft_karp(graph, [("l", i) for i in range(n)])
+		self.assertEqual(len(matching), n)
+
+class TestMaxFlow(unittest.TestCase):
+
+	def test_max_flow(self):
+		value, flows = flow.max_flow(network(), "s", "t")
+		self.assertEqual(value, 23)
+		self.assertEqual(sum(flows["s"].values()), 23)
+		self.assertEqual(flows["v3"]["t"] + flows["v4"]["t"], 23)
+		for v in ["v1", "v2", "v3", "v4"]:
+			incoming = sum(f.get(v, 0) for f in flows.values())
+			self.assertEqual(incoming, sum(flows.get(v, {}).values()))
+
+	def test_min_cut(self):
+		value, side = flow.min_cut(network(), "s", "t")
+		self.assertEqual(value, 23)
+		self.assertTrue(side == set(["s", "v1", "v2", "v4"]))
+
+	def test_default_capacity(self):
+		graph = Graph({"s": set(["a", "b"]), "a": set(["t"]), "b": set(["t"]), "t": set()}, digraph=True)
+		self.assertEqual(flow.max_flow(graph, "s", "t")[0], 2)
+		self.assertEqual(flow.max_flow(graph, "s", "t", default=2.5)[0], 5.0)
+
+	def test_no_path(self):
+		graph = Graph({"s": set(), "t": set(["s"])}, digraph=True)
+		self.assertEqual(flow.max_flow(graph, "s", "t"), (0, {}))
+
+	def test_long_path(self):
+		n = 5000
+		graph = Graph(dict((i, set([i + 1]) if i + 1 < n else set()) for i in range(n)), digraph=True)
+		self.assertEqual(flow.max_flow(graph, 0, n - 1)[0], 1)
+
+if __name__ == "__main__":
+	unittest.main()
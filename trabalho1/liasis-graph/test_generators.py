@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+import unittest
+import generators
+
+def edges(graph):
+	return sum(len(graph._vertices[v]) for v in graph._vertices) // (1 if graph._digraph else 2)
+
+def symmetric(graph):
+	return all(v in graph._vertices[u] for v in graph._vertices for u in graph._vertices[v])
+
+class TestGenerators(unittest.TestCase):
+
+	def test_complete_graph(self):
+		graph = generators.complete_graph(6)
+		self.assertTrue(graph.is_complete())
+		self.assertEqual(edges(graph), 15)
+		self.assertEqual(edges(generators.complete_graph(4, digraph=True)), 12)
+
+	def test_grid_graph(self):
+		graph = generators.grid_graph(3, 4)
+		self.assertEqual(graph.order(), 12)
+		self.assertEqual(edges(graph), 3 * 3 + 2 * 4)
+		self.assertEqual(graph.degree(0), 2)
+		self.assertEqual(graph.degree(5), 4)
+
+	def test_erdos_renyi(self):
+		graph = generators.erdos_renyi(2000, 0.01, seed=1)
+		self.assertEqual(graph.order(), 2000)
+		self.assertTrue(symmetric(graph))
+		self.assertTrue(all(v not in graph._vertices[v] for v in graph._vertices))
+		expected = 0.01 * 2000 * 1999 / 2
+		self.assertTrue(abs(edges(graph) - expected) < 0.1 * expected)
+
+	def test_erdos_renyi_digraph(self):
+		graph = generators.erdos_renyi(500, 0.02, seed=1, digraph=True)
+		self.assertTrue(all(v not in graph._vertices[v] for v in graph._vertices))
+		expected = 0.02 * 500 * 499
+		self.assertTrue(abs(edges(graph) - expected) < 0.1 * expected)
+
+	def test_erdos_renyi_limits(self):
+		self.assertEqual(edges(generators.erdos_renyi(10, 0.0)), 0)
+		self.assertEqual(edges(generators.erdos_renyi(10, 1.0)), 45)
+
+	def test_seed(self):
+		first = generators.erdos_renyi(300, 0.05, seed=7)
+		second = generators.erdos_renyi(300, 0.05, seed=7)
+		self.assertEqual(first._vertices, second._vertices)
+		first = generators.watts_strogatz(100, 4, 0.3, seed=7)
+		second = generators.watts_strogatz(100, 4, 0.3, seed=7)
+		self.assertEqual(first._vertices, second._vertices)
+
+	def test_barabasi_albert(self):
+		graph = generators.barabasi_albert(1000, 3, seed=1)
+		self.assertEqual(graph.order(), 1000)
+		self.assertEqual(edges(graph), 3 * (1000 - 3))
+		self.assertTrue(symmetric(graph))
+		self.assertTrue(max(graph.degree(v) for v in range(1000)) > 30)
+		with self.assertRaises(ValueError):
+			generators.barabasi_albert(3, 3)
+
+	def test_watts_strogatz(self):
+		ring = generators.watts_strogatz(20, 4, 0.0, seed=1)
+		self.assertTrue(ring.is_regular())
+		self.assertEqual(edges(ring), 40)
+		graph = generators.watts_strogatz(200, 6, 0.5, seed=1)
+		self.assertEqual(edges(graph), 600)
+		self.assertTrue(symmetric(graph))
+		with self.assertRaises(ValueError):
+			generators.watts_strogatz(10, 3, 0.1)
+
+	def test_rmat(self):
+		graph = generators.rmat(10, edge_factor=8, seed=1)
+		self.assertEqual(graph.order(), 1024)
+		self.assertTrue(symmetric(graph))
+		self.assertTrue(0 < edges(graph) <= 8 * 1024)
+		self.assertTrue(all(v not in graph._vertices[v] for v in graph._vertices))
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+import random
+import unittest
+import generators
+import hashing
+import subgraph
+from concurrent_graph import ConcurrentGraph
+from graph import Graph
+
+def path(labels):
+	graph = Graph(dict((v, set()) for v in labels))
+	for a, b in zip(labels, labels[1:]):
+		graph.connect(a, b)
+	return graph
+
+class Equality(unittest.TestCase):
+
+	def test_equal_graphs(self):
+		self.assertEqual(path("abcd"), path("abcd"))
+		self.assertEqual(path("abcd"), path("dcba"))
+		self.assertNotEqual(path("abcd"), path("abdc"))
+		self.assertNotEqual(path("abc"), Graph({"a": set(["b"]), "b": set(), "c": set()}, digraph=True))
+		self.assertNotEqual(path("abc"), "abc")
+
+	def test_graphs_are_not_hashable(self):
+		with self.assertRaises(TypeError):
+			hash(path("ab"))
+
+	def test_fingerprint_follows_mutations(self):
+		rnd = random.Random(3)
+		for digraph in (False, True):
+			graph = Graph(dict((v, set()) for v in range(10)), digraph)
+			graph.fingerprint()
+			for _ in range(300):
+				a, b = rnd.randrange(12), rnd.randrange(12)
+				operation = rnd.choice(("add", "remove", "connect", "connect", "disconnect"))
+				if operation == "add":
+					graph.add(a)
+				elif operation == "remove":
+					graph.remove(a)
+				else:
+					getattr(graph, operation)(a, b)
+				copy = Graph(dict((v, set(graph._vertices[v])) for v in graph._vertices), digraph)
+				self.assertEqual(graph.fingerprint(), copy.fingerprint())
+				self.assertEqual(graph, copy)
+
+	def test_fingerprint_in_batches(self):
+		graph = path("abc")
+		before = graph.fingerprint()
+		with graph.batch():
+			graph.add("d")
+			graph.connect("c", "d")
+			graph.disconnect("c", "d")
+			graph.remove("d")
+		self.assertEqual(graph.fingerprint(), before)
+
+	def test_subgraph_view(self):
+		graph = path("abcd")
+		view = subgraph.induced_subgraph(graph, "abc")
+		self.assertEqual(view, path("abc"))
+		graph.disconnect("b", "c")
+		self.assertEqual(view.fingerprint(), Graph({"a": set(["b"]), "b": set(["a"]), "c": set()}).fingerprint())
+		self.assertNotEqual(view, path("abc"))
+
+	def test_snapshots_carry_the_fingerprint(self):
+		graph = ConcurrentGraph(dict((v, set()) for v in "abc"))
+		graph.fingerprint()
+		with graph.batch() as writer:
+			writer.connect("a", "b")
+			writer.connect("b", "c")
+			writer.add("d")
+			writer.remove("d")
+		snapshot = graph.snapshot()
+		self.assertEqual(snapshot._fingerprint, path("abc").fingerprint())
+		with graph.batch() as writer:
+			writer.remove("b")
+		self.assertEqual(graph.snapshot(), Graph({"a": set(), "c": set()}))
+		self.assertEqual(graph.fingerprint(), Graph({"a": set(), "c": set()}).fingerprint())
+
+class WeisfeilerLehman(unittest.TestCase):
+
+	def test_isomorphic_graphs(self):
+		graph = generators.erdos_renyi(40, 0.1, seed=1)
+		order = list(range(40))
+		random.Random(2).shuffle(order)
+		relabelled = Graph(dict((order[v], set(order[u] for u in graph._vertices[v])) for v in graph._vertices))
+		self.assertEqual(hashing.weisfeiler_lehman(graph), hashing.weisfeiler_lehman(relabelled))
+		self.assertTrue(hashing.may_be_isomorphic(graph, relabelled))
+
+	def test_different_graphs(self):
+		star = Graph({0: set([1, 2, 3]), 1: set([0]), 2: set([0]), 3: set([0])})
+		self.assertNotEqual(hashing.weisfeiler_lehman(path("abcd")), hashing.weisfeiler_lehman(star))
+		self.assertFalse(hashing.may_be_isomorphic(path("abcd"), star))
+		self.assertFalse(hashing.may_be_isomorphic(path("abcd"), path("abc")))
+
+	def test_digraphs(self):
+		forward = Graph({"a": set(["b"]), "b": set(["c"]), "c": set()}, digraph=True)
+		inward = Graph({"a": set(["b"]), "b": set(), "c": set(["b"])}, digraph=True)
+		self.assertNotEqual(hashing.weisfeiler_lehman(forward), hashing.weisfeiler_lehman(inward))
+		self.assertNotEqual(hashing.weisfeiler_lehman(path("abc")), hashing.weisfeiler_lehman(forward))
+
+	def test_attributes(self):
+		first, second = path("abc"), path("abc")
+		self.assertEqual(hashing.weisfeiler_lehman(first, attribute="color"),
+			hashing.weisfeiler_lehman(second, attribute="color"))
+		first.set_vertex_attribute("a", "color", "red")
+		second.set_vertex_attribute("b", "color", "red")
+		self.assertNotEqual(hashing.weisfeiler_lehman(first, attribute="color"),
+			hashing.weisfeiler_lehman(second, attribute="color"))
+
+if __name__ == "__main__":
+	unittest.main()
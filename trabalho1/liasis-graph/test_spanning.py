@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+import random
+import unittest
+import spanning
+from graph import Graph
+
+def weighted():
+	graph = Graph(dict((v, set()) for v in "abcde"))
+	weights = {
+		("a", "b"): 4, ("a", "c"): 1, ("b", "c"): 2, ("b", "d"): 5,
+		("c", "d"): 8, ("d", "e"): 3, ("c", "e"): 9
+	}
+	for a, b in weights:
+		graph.connect(a, b)
+	graph.set_edge_attributes("weight", weights)
+	return graph
+
+class TestSpanning(unittest.TestCase):
+
+	def test_kruskal(self):
+		tree, total = spanning.kruskal(weighted())
+		self.assertEqual(total, 11)
+		self.assertEqual(tree.order(), 5)
+		self.assertTrue(tree.adjacents_to("c") == set(["a", "b"]))
+		self.assertTrue(tree.adjacents_to("d") == set(["b", "e"]))
+		self.assertEqual(tree.edge_attribute("d", "e", "weight"), 3)
+
+	def test_prim(self):
+		tree, total = spanning.prim(weighted())
+		self.assertEqual(total, 11)
+		self.assertEqual(len(list(tree.edges())), 4)
+
+	def test_forest(self):
+		graph = weighted()
+		graph.add("x")
+		graph.add("y")
+		graph.connect("x", "y")
+		for algorithm in ("kruskal", "prim"):
+			forest, total = spanning.minimum_spanning_tree(graph, algorithm=algorithm)
+			self.assertEqual(total, 12)
+			self.assertEqual(forest.order(), 7)
+			self.assertEqual(len(list(forest.edges())), 5)
+
+	def test_same_total_on_random_graphs(self):
+		rnd = random.Random(5)
+		for _ in range(20):
+			vertices = dict((v, set()) for v in range(30))
+			graph = Graph(vertices)
+			for _ in range(80):
+				a, b = rnd.randrange(30), rnd.randrange(30)
+				if a != b:
+					graph.connect(a, b)
+					graph.set_edge_attribute(a, b, "cost", rnd.random())
+			first = spanning.kruskal(graph, weight="cost")[1]
+			second = spanning.prim(graph, weight="cost")[1]
+			self.assertAlmostEqual(first, second)
+
+	def test_errors(self):
+		with self.assertRaises(NotImplementedError):
+			spanning.kruskal(Graph({"a": set()}, digraph=True))
+		with self.assertRaises(ValueError):
+			spanning.minimum_spanning_tree(weighted(), algorithm="boruvka")
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+import unittest
+from graph import Graph
+from graph_exceptions import ReadOnlyGraphError, NotDigraphError
+from subgraph import induced_subgraph, vertex_filtered, edge_filtered
+
+class TestSubgraphView(unittest.TestCase):
+
+	def setUp(self):
+		self.graph = Graph({
+			"a": set(["b", "c", "d"]),
+			"b": set(["a", "c"]),
+			"c": set(["a", "b", "e"]),
+			"d": set(["a"]),
+			"e": set(["c"])
+		})
+
+	def test_induced_subgraph(self):
+		view = induced_subgraph(self.graph, ["a", "b", "c", "z"])
+		self.assertEqual(view.order(), 3)
+		self.assertTrue(view.vertices() == set(["a", "b", "c"]))
+		self.assertTrue(view.adjacents_to("a") == set(["b", "c"]))
+		self.assertTrue(view.adjacents_to("d") == set())
+		self.assertEqual(view.degree("c"), 2)
+		self.assertTrue(view.is_regular())
+		self.assertTrue(view.is_complete())
+
+	def test_vertex_filtered(self):
+		view = vertex_filtered(self.graph, lambda v: v != "a")
+		self.assertEqual(view.order(), 4)
+		self.assertTrue(view.adjacents_to("c") == set(["b", "e"]))
+		self.assertEqual(view.degree("d"), 0)
+		self.assertFalse(view.is_regular())
+
+	def test_edge_filtered(self):
+		view = edge_filtered(self.graph, [("a", "b"), ("c", "a")])
+		self.assertEqual(view.order(), 5)
+		self.assertTrue(view.adjacents_to("a") == set(["b", "c"]))
+		self.assertTrue(view.adjacents_to("c") == set(["a"]))
+		self.assertEqual(view.degree("e"), 0)
+
+	def test_edge_filtered_with_function(self):
+		view = edge_filtered(self.graph, lambda a, b: "a" not in (a, b))
+		self.assertEqual(view.degree("a"), 0)
+		self.assertTrue(view.adjacents_to("c") == set(["b", "e"]))
+
+	def test_views_reflect_the_graph(self):
+		view = induced_subgraph(self.graph, ["a", "b", "c"])
+		self.graph.disconnect("a", "b")
+		self.assertTrue(view.adjacents_to("a") == set(["c"]))
+		self.graph.remove("c")
+		self.assertEqual(view.order(), 2)
+
+	def test_view_is_read_only(self):
+		view = induced_subgraph(self.graph, ["a", "b"])
+		with self.assertRaises(ReadOnlyGraphError):
+			view.connect("a", "b")
+		with self.assertRaises(ReadOnlyGraphError):
+			view.remove("a")
+
+	def test_materialize(self):
+		view = induced_subgraph(self.graph, ["a", "b", "c"])
+		copy = view.materialize()
+		copy.remove("c")
+		self.assertEqual(view.order(), 3)
+		self.assertTrue(copy.adjacents_to("a") == set(["b"]))
+		self.assertTrue(self.graph.adjacents_to("a") == set(["b", "c", "d"]))
+
+	def test_digraph(self):
+		graph = Graph({
+			"a": set(["b", "c"]),
+			"b": set(["c"]),
+			"c": set(["a"])
+		}, digraph=True)
+		view = induced_subgraph(graph, ["a", "b"])
+		self.assertTrue(view.sucessors("a") == set(["b"]))
+		self.assertTrue(view.predecessors("b") == set(["a"]))
+		self.assertEqual(view.in_degree("a"), 0)
+		view = edge_filtered(graph, [("b", "a"), ("b", "c")])
+		self.assertTrue(view.sucessors("b") == set(["c"]))
+		self.assertTrue(view.sucessors("a") == set())
+		with self.assertRaises(NotDigraphError):
+			induced_subgraph(self.graph, ["a"]).sucessors("a")
+
+	def test_nested_views(self):
+		view = induced_subgraph(induced_subgraph(self.graph, ["a", "b", "c"]), ["a", "c", "e"])
+		self.assertTrue(view.vertices() == set(["a", "c"]))
+		self.assertTrue(view.adjacents_to("c") == set(["a"]))
+
+	def test_attributes_are_filtered(self):
+		self.graph.set_vertex_attributes("age", {"a": 1, "b": 2, "c": 3})
+		self.graph.set_edge_attributes("w", {("a", "b"): 4, ("b", "c"): 5, ("c", "e"): 6})
+		view = induced_subgraph(self.graph, ["a", "b"])
+		self.assertEqual(view.vertex_attributes("age"), {"a": 1, "b": 2})
+		self.assertEqual(view.vertex_attribute("c", "age"), None)
+		self.assertEqual(view.vertex_attribute("a", "age"), 1)
+		self.assertEqual(view.edge_attribute("b", "c", "w"), None)
+		self.assertEqual(view.edge_attribute("b", "a", "w"), 4)
+		self.assertEqual(view.edge_attributes("w"), {"a": {"b": 4}, "b": {"a": 4}})
+		view = edge_filtered(self.graph, [("b", "c")])
+		self.assertEqual(view.edge_attribute("a", "b", "w", 0), 0)
+		self.assertEqual(view.edge_attributes("w"), {"b": {"c": 5}, "c": {"b": 5}})
+		nested = induced_subgraph(view, ["b", "c", "e"])
+		self.assertEqual(nested.edge_attributes("w"), {"b": {"c": 5}, "c": {"b": 5}})
+		self.assertEqual(nested.vertex_attributes("age"), {"b": 2, "c": 3})
+
+	def test_materialize_copies_attributes(self):
+		self.graph.set_vertex_attributes("age", {"a": 1, "d": 4})
+		self.graph.set_edge_attributes("w", {("a", "b"): 4, ("c", "e"): 6})
+		copy = induced_subgraph(self.graph, ["a", "b", "c"]).materialize()
+		self.assertEqual(copy.vertex_attributes("age"), {"a": 1})
+		self.assertEqual(copy.edge_attributes("w"), {"a": {"b": 4}, "b": {"a": 4}})
+		copy.set_edge_attribute("a", "b", "w", 7)
+		self.assertEqual(self.graph.edge_attribute("a", "b", "w"), 4)
+		copy.disconnect("a", "b")
+		self.assertEqual(copy.edge_attributes("w"), {"a": {}, "b": {}})
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,30 @@
+#!/usr/bin/env python
+import unittest
+import workers
+
+def _double(i):
+	shared = workers.view(workers.state)
+	shared[i] *= 2
+	return shared[i]
+
+class TestWorkers(unittest.TestCase):
+
+	def test_chunks(self):
+		self.assertEqual(workers.chunks(list(range(5)), 2), [[0, 1, 2], [3, 4]])
+		self.assertEqual(workers.chunks([], 3), [])
+
+	def test_ranges(self):
+		self.assertEqual(workers.ranges(5, 2), [(0, 3), (3, 5)])
+		self.assertEqual(workers.ranges(2, 4), [(0, 1), (1, 2)])
+		self.assertEqual(workers.ranges(0, 4), [])
+
+	def test_shared_array(self):
+		shared = workers.shared_array("l", range(6))
+		with workers.pool(2, shared) as pool:
+			self.assertEqual(list(pool.map(_double, range(6))), [0, 2, 4, 6, 8, 10])
+		self.assertEqual(list(workers.view(shared)), [0, 2, 4, 6, 8, 10])
+		values = workers.shared_array("d", [0.5, 1.5])
+		self.assertEqual(list(workers.view(values)), [0.5, 1.5])
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+"""
+Helpers for the modules that split their work across a process pool
+(centrality, community).
+
+The read-only data of an algorithm (its CSR, its adjacency...) is handed to
+every worker once, when the pool starts, and kept in *state*; tasks then only
+carry what changes between them. Data that changes between rounds and must be
+seen by every worker can live in shared arrays instead of being pickled into
+every task:
+
+    labels = shared_array("l", range(n))   # visible to the workers of the pool
+    view(labels)[i] = 3                     # fast indexing, in any process
+
+=========================================
+
+Functions:
+
+    void initialize(value)
+    ProcessPoolExecutor pool(processes, value)
+    list(list) chunks(items, count)
+    list((start, stop)) ranges(n, count)
+    RawArray shared_array(typecode, values)
+    memoryview view(shared)
+
+=========================================
+
+@license: MIT License
+"""
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.sharedctypes import RawArray
+
+state = None
+
+def initialize(value):
+    """ Keep *value* in the state of the current process (the pool initializer). """
+    global state
+    state = value
+
+def pool(processes, value):
+    """ Return a ProcessPoolExecutor whose workers start with *value* as their state. """
+    return ProcessPoolExecutor(processes, initializer=initialize, initargs=(value,))
+
+def chunks(items, count):
+    """ Split a list in at most *count* slices of the same size. """
+    size = max(1, (len(items) + count - 1) // count)
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+def ranges(n, count):
+    """ Split 0..n-1 in at most *count* (start, stop) ranges of the same size. """
+    size = max(1, (n + count - 1) // count)
+    return [(start, min(n, start + size)) for start in range(0, n, size)]
+
+def shared_array(typecode, values):
+    """ Return an array in shared memory ('b', 'l' or 'd') filled with *values*.
+
+    It must be created before the pool (and given to it in its state) to be
+    shared with the workers.
+    """
+    values = array(typecode, values)
+    shared = RawArray(typecode, len(values))
+    view(shared)[:] = values
+    return shared
+
+def view(shared):
+    """ Return a memoryview of a shared array, much faster to index than the array itself. """
+    return memoryview(shared).cast("B").cast(shared._type_._type_)